@@ -0,0 +1,124 @@
+"""Initial schema: users, wishlists, items, reservations.
+
+Databases created earlier by Base.metadata.create_all are adopted in place: existing
+tables are left alone and only columns added since then are filled in.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("hashed_password", sa.String(255), nullable=False),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("pushover_user_key", sa.String(64), nullable=True),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+    else:
+        op.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS pushover_user_key VARCHAR(64)")
+
+    if "wishlists" not in existing:
+        op.create_table(
+            "wishlists",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "owner_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("users.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("public_slug", sa.String(64), nullable=False),
+            sa.Column("deadline", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index("ix_wishlists_public_slug", "wishlists", ["public_slug"], unique=True)
+
+    if "items" not in existing:
+        op.create_table(
+            "items",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "wishlist_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("wishlists.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column("sort_order", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(512), nullable=False),
+            sa.Column("price", sa.Numeric(12, 2), nullable=True),
+            sa.Column("image_url", sa.String(2048), nullable=True),
+            sa.Column("product_url", sa.String(2048), nullable=True),
+            sa.Column("allow_contributions", sa.Boolean(), nullable=False),
+            sa.Column("cached_snapshot_json", postgresql.JSONB(), nullable=True),
+            sa.Column("reserved_total", sa.Numeric(12, 2), server_default="0", nullable=False),
+            sa.Column("contributors_count", sa.Integer(), server_default="0", nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    else:
+        op.execute(
+            "ALTER TABLE items ADD COLUMN IF NOT EXISTS reserved_total NUMERIC(12, 2) NOT NULL DEFAULT 0"
+        )
+        op.execute(
+            "ALTER TABLE items ADD COLUMN IF NOT EXISTS contributors_count INTEGER NOT NULL DEFAULT 0"
+        )
+    if "items" in existing and "reservations" in existing:
+        # Totals columns may have just been added with zeros: derive them from reservations
+        op.execute(
+            """
+            UPDATE items SET
+                reserved_total = COALESCE(
+                    (SELECT SUM(r.amount) FROM reservations r WHERE r.item_id = items.id), 0),
+                contributors_count = (SELECT COUNT(*) FROM reservations r WHERE r.item_id = items.id)
+            """
+        )
+
+    if "reservations" not in existing:
+        op.create_table(
+            "reservations",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column(
+                "item_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("items.id", ondelete="CASCADE"),
+                nullable=False,
+            ),
+            sa.Column(
+                "user_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey("users.id", ondelete="SET NULL"),
+                nullable=True,
+            ),
+            sa.Column("guest_name", sa.String(255), nullable=True),
+            sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+            sa.Column("is_full_reservation", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("reservations")
+    op.drop_table("items")
+    op.drop_table("wishlists")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
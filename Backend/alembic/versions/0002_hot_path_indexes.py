@@ -0,0 +1,43 @@
+"""Indexes for hot query paths (foreign keys had none).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Item lists / public page: WHERE wishlist_id = ? ORDER BY sort_order, created_at
+    op.create_index(
+        "ix_items_wishlist_id_sort_order_created_at",
+        "items",
+        ["wishlist_id", "sort_order", "created_at"],
+    )
+    # Per-item reservations (ordered) and totals repair
+    op.create_index(
+        "ix_reservations_item_id_created_at", "reservations", ["item_id", "created_at"]
+    )
+    # ON DELETE SET NULL from users
+    op.create_index("ix_reservations_user_id", "reservations", ["user_id"])
+    # Owner dashboard: WHERE owner_id = ? ORDER BY created_at DESC
+    op.create_index(
+        "ix_wishlists_owner_id_created_at",
+        "wishlists",
+        ["owner_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_wishlists_owner_id_created_at", table_name="wishlists")
+    op.drop_index("ix_reservations_user_id", table_name="reservations")
+    op.drop_index("ix_reservations_item_id_created_at", table_name="reservations")
+    op.drop_index("ix_items_wishlist_id_sort_order_created_at", table_name="items")
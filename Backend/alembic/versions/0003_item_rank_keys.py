@@ -0,0 +1,74 @@
+"""Order items by fractional rank keys instead of integer sort_order.
+
+Existing items get keys in their current order (sort_order, created_at), computed in SQL so
+the migration does not depend on application code and works in offline (--sql) mode: the
+item's 0-based position n becomes the fixed-width integer key "d" + 4 base-62 digits of n
+(valid for app/services/ranking.py, up to 62**4 items per wishlist).
+Keys must compare byte-wise, hence COLLATE "C".
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Digit alphabet of the rank keys, in byte order (copied: migrations must not import app code)
+BASE62_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+def upgrade() -> None:
+    op.add_column("items", sa.Column("rank", sa.String(255, collation="C"), nullable=True))
+
+    op.execute(
+        f"""
+        UPDATE items SET rank = 'd'
+            || substr('{BASE62_DIGITS}', (ordered.n / 238328 % 62)::int + 1, 1)
+            || substr('{BASE62_DIGITS}', (ordered.n / 3844 % 62)::int + 1, 1)
+            || substr('{BASE62_DIGITS}', (ordered.n / 62 % 62)::int + 1, 1)
+            || substr('{BASE62_DIGITS}', (ordered.n % 62)::int + 1, 1)
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY wishlist_id ORDER BY sort_order, created_at) - 1 AS n
+            FROM items
+        ) AS ordered
+        WHERE items.id = ordered.id
+        """
+    )
+
+    op.alter_column("items", "rank", nullable=False)
+    op.drop_index("ix_items_wishlist_id_sort_order_created_at", table_name="items")
+    op.create_index(
+        "ix_items_wishlist_id_rank_created_at", "items", ["wishlist_id", "rank", "created_at"]
+    )
+    op.drop_column("items", "sort_order")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "items",
+        sa.Column("sort_order", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE items SET sort_order = ordered.pos
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY wishlist_id ORDER BY rank, created_at) - 1 AS pos
+            FROM items
+        ) AS ordered
+        WHERE items.id = ordered.id
+        """
+    )
+    op.drop_index("ix_items_wishlist_id_rank_created_at", table_name="items")
+    op.create_index(
+        "ix_items_wishlist_id_sort_order_created_at",
+        "items",
+        ["wishlist_id", "sort_order", "created_at"],
+    )
+    op.drop_column("items", "rank")
@@ -0,0 +1,45 @@
+"""Extend list indexes with id so keyset pages are a single index range scan.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /wishlists: WHERE owner_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+    op.create_index(
+        "ix_wishlists_owner_id_created_at_id",
+        "wishlists",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("ix_wishlists_owner_id_created_at", table_name="wishlists")
+    # GET /wishlists/{id}/items: WHERE wishlist_id = ? AND (rank, created_at, id) > (?, ?, ?)
+    op.create_index(
+        "ix_items_wishlist_id_rank_created_at_id",
+        "items",
+        ["wishlist_id", "rank", "created_at", "id"],
+    )
+    op.drop_index("ix_items_wishlist_id_rank_created_at", table_name="items")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_items_wishlist_id_rank_created_at", "items", ["wishlist_id", "rank", "created_at"]
+    )
+    op.drop_index("ix_items_wishlist_id_rank_created_at_id", table_name="items")
+    op.create_index(
+        "ix_wishlists_owner_id_created_at",
+        "wishlists",
+        ["owner_id", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_wishlists_owner_id_created_at_id", table_name="wishlists")
@@ -0,0 +1,26 @@
+"""Per-wishlist WebSocket event sequence number.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "wishlists",
+        sa.Column("event_seq", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("wishlists", "event_seq")
@@ -1,3 +1,17 @@
-from app.api.deps import get_current_user, get_current_user_optional
+from app.api.deps import (
+    get_current_principal,
+    get_current_principal_optional,
+    get_current_user,
+    get_current_user_id,
+    get_current_user_id_optional,
+    get_current_user_optional,
+)
 
-__all__ = ["get_current_user", "get_current_user_optional"]
+__all__ = [
+    "get_current_principal",
+    "get_current_principal_optional",
+    "get_current_user",
+    "get_current_user_id",
+    "get_current_user_id_optional",
+    "get_current_user_optional",
+]
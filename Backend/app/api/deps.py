@@ -1,4 +1,10 @@
-"""FastAPI dependencies: current user from JWT (Bearer token)."""
+"""FastAPI dependencies: current user from JWT (Bearer token).
+
+Pick the lightest one an endpoint needs:
+  - get_current_user_id: JWT only, no DB (ownership checks compare ids).
+  - get_current_principal: slim cached Principal (id, name, pushover key).
+  - get_current_user: full ORM User (profile endpoints).
+"""
 
 from uuid import UUID
 
@@ -9,16 +15,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.security import decode_token
 from app.db.session import get_db
 from app.models.user import User
-from app.services.user_service import get_user_by_id
+from app.services.user_service import Principal, get_principal, get_user_by_id
 
 # Bearer token in Authorization header (OAuth2-compatible)
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user_optional(
+def _not_authenticated() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Not authenticated",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user_id_optional(
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    session: AsyncSession = Depends(get_db),
-) -> User | None:
+) -> UUID | None:
     if not credentials:
         return None
     payload = decode_token(credentials.credentials)
@@ -28,20 +41,48 @@ async def get_current_user_optional(
     if not sub:
         return None
     try:
-        user_id = UUID(sub)
+        return UUID(sub)
     except ValueError:
         return None
-    user = await get_user_by_id(session, user_id)
-    return user
+
+
+async def get_current_user_id(
+    user_id: UUID | None = Depends(get_current_user_id_optional),
+) -> UUID:
+    if user_id is None:
+        raise _not_authenticated()
+    return user_id
+
+
+async def get_current_principal_optional(
+    user_id: UUID | None = Depends(get_current_user_id_optional),
+    session: AsyncSession = Depends(get_db),
+) -> Principal | None:
+    if user_id is None:
+        return None
+    return await get_principal(session, user_id)
+
+
+async def get_current_principal(
+    principal: Principal | None = Depends(get_current_principal_optional),
+) -> Principal:
+    if principal is None:
+        raise _not_authenticated()
+    return principal
+
+
+async def get_current_user_optional(
+    user_id: UUID | None = Depends(get_current_user_id_optional),
+    session: AsyncSession = Depends(get_db),
+) -> User | None:
+    if user_id is None:
+        return None
+    return await get_user_by_id(session, user_id)
 
 
 async def get_current_user(
     user: User | None = Depends(get_current_user_optional),
 ) -> User:
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _not_authenticated()
     return user
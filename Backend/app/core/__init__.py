@@ -1,7 +1,9 @@
 from app.core.config import get_settings, Settings
 from app.core.security import (
     verify_password,
+    verify_password_async,
     get_password_hash,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -11,7 +13,9 @@ __all__ = [
     "get_settings",
     "Settings",
     "verify_password",
+    "verify_password_async",
     "get_password_hash",
+    "get_password_hash_async",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
@@ -29,10 +29,77 @@ class Settings(BaseSettings):
             return v.replace("postgresql://", "postgresql+asyncpg://", 1)
         return v
 
+    # Connection pool (per process). Echo is separate from debug so SQL logging is opt-in.
+    db_echo: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # asyncpg statement cache; set 0 behind PgBouncer in transaction pooling mode
+    db_statement_cache_size: int = 100
+
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 60
     jwt_refresh_token_expire_days: int = 7
 
+    # Authenticated principal (id, name, pushover key) cached per user id between requests
+    principal_cache_ttl_seconds: float = 60.0
+    principal_cache_size: int = 10_000
+
+    # bcrypt runs in a dedicated thread pool; logins/registrations get 503 beyond the backlog
+    password_hash_workers: int = 4
+    password_hash_max_backlog: int = 64
+
+    # GET /api/internal/metrics requires header X-Internal-Token with this value (disabled if unset)
+    internal_metrics_token: str | None = None
+
+    # Cross-worker cache invalidation: "postgres" (LISTEN/NOTIFY) or "memory" (single process / tests)
+    invalidation_backend: str = "postgres"
+    # WebSocket event fan-out across workers: "postgres" (LISTEN/NOTIFY) or "memory" (single process / tests)
+    ws_backplane: str = "postgres"
+    # Outbound WebSocket messages buffered per client; a client that falls further behind is closed (1013)
+    ws_send_queue_size: int = 100
+    # Replay on reconnect (?last_seq=N): recent events kept per wishlist, for how many wishlists, and how long
+    ws_replay_size: int = 50
+    ws_replay_wishlists: int = 10_000
+    ws_replay_ttl_seconds: float = 600.0
+
+    # Public wishlist pages: serialized responses cached per slug, dropped on every change
+    public_cache_size: int = 1000
+    public_cache_ttl_seconds: float = 60.0
+
+    # List endpoints (keyset pagination): page size when ?limit is omitted, and the hard cap
+    page_size_default: int = 50
+    page_size_max: int = 200
+
+    # Item rank keys longer than this get rebalanced in the background
+    item_rank_rebalance_length: int = 24
+
+    # Reservations: per-item row lock wait before a retry, and how many retries before failing
+    reservation_lock_timeout_ms: int = 2000
+    reservation_max_retries: int = 3
+
+    # Outbound HTTP (shared pooled clients): HTTP/2 when the "h2" package is installed, idle
+    # keep-alive lifetime, and per-purpose connection caps
+    http2_enabled: bool = True
+    http_keepalive_expiry_seconds: float = 30.0
+    product_fetch_max_connections: int = 20
+    product_fetch_max_keepalive: int = 10
+    pushover_max_connections: int = 5
+
+    # Product pages are streamed only up to </head>, and never beyond this many bytes
+    product_fetch_max_bytes: int = 1_000_000
+    # Page heads larger than this are parsed in a process pool (workers, backlog, per-page timeout)
+    product_parse_inline_max_bytes: int = 65_536
+    product_parse_workers: int = 2
+    product_parse_max_backlog: int = 16
+    product_parse_timeout_seconds: float = 5.0
+    # Product previews cached per normalized URL (per process): successes, and failures for a shorter time
+    product_cache_size: int = 2000
+    product_cache_ttl_seconds: float = 900.0
+    product_cache_negative_ttl_seconds: float = 60.0
+
     # CORS: allow localhost:3000 (frontend) and * for dev
     cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173"
 
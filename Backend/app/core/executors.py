@@ -0,0 +1,155 @@
+"""Bounded worker pools for blocking / CPU-bound work called from async handlers."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, Executor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(Exception):
+    """The pool already has max_backlog tasks queued or running; caller should shed load."""
+
+
+class BoundedExecutor:
+    """Run blocking callables in a concurrent.futures pool without blocking the event loop.
+    Refuses new work once max_backlog tasks are pending (queued + running), and keeps
+    counters for metrics. The underlying pool is created lazily on first use.
+
+    With recycle_on_timeout (process pools only: threads cannot be killed) a task that times
+    out retires its pool: new work goes to a fresh pool at once, the other tasks already in the
+    old one are left to finish, and only then are its worker processes terminated, so a runaway
+    task does not keep holding a worker and is the only one lost. A pool broken for any other
+    reason (e.g. a worker killed by the OOM killer) is replaced the same way.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[int], Executor],
+        max_workers: int,
+        max_backlog: int,
+        *,
+        recycle_on_timeout: bool = False,
+    ) -> None:
+        self.name = name
+        self.recycle_on_timeout = recycle_on_timeout
+        self.max_workers = max_workers
+        self.max_backlog = max_backlog
+        self._factory = factory
+        self._executor: Executor | None = None
+        # Per pool: futures still awaited (timed-out ones are dropped); retired pools' workers
+        self._outstanding: dict[Executor, set[Any]] = {}
+        self._retired: dict[Executor, list[Any]] = {}
+        self._pending = 0
+        self.submitted = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.recycled = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._factory(self.max_workers)
+        return self._executor
+
+    def _task_done(self, executor: Executor, future: Any) -> None:
+        self._pending -= 1
+        outstanding = self._outstanding.get(executor)
+        if outstanding is not None:
+            outstanding.discard(future)
+            self._reap(executor)
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: float | None = None) -> T:
+        """Run fn(*args) in the pool. Raises ExecutorSaturatedError when the backlog is full
+        and asyncio.TimeoutError when timeout elapses (the task itself is not interrupted).
+        """
+        if self._pending >= self.max_backlog:
+            self.rejected += 1
+            raise ExecutorSaturatedError(f"{self.name} pool is saturated ({self._pending} pending)")
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            cf_future = executor.submit(fn, *args)
+        except BrokenExecutor:
+            self._retire(executor)
+            raise
+        self._outstanding.setdefault(executor, set()).add(cf_future)
+        self._pending += 1
+        self.submitted += 1
+
+        def on_done(f: Any) -> None:
+            # Count the slot as busy until the worker actually finishes, even if we stop waiting
+            try:
+                loop.call_soon_threadsafe(self._task_done, executor, f)
+            except RuntimeError:
+                pass  # loop already closed (shutdown)
+
+        cf_future.add_done_callback(on_done)
+        future = asyncio.wrap_future(cf_future, loop=loop)
+        try:
+            if timeout is None:
+                return await future
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if self.recycle_on_timeout:
+                self._retire(executor, abandoned=cf_future)
+            raise
+        except BrokenExecutor:
+            self._retire(executor)
+            raise
+
+    def _retire(self, executor: Executor, *, abandoned: Any = None) -> None:
+        """Stop submitting to executor (if still current) and terminate its worker processes
+        once every task still awaited from it is done; abandoned (timed out) is not awaited.
+        """
+        outstanding = self._outstanding.setdefault(executor, set())
+        outstanding.discard(abandoned)
+        if self._executor is executor:
+            self._executor = None
+            self.recycled += 1
+            # ProcessPoolExecutor keeps its workers in _processes (cleared by shutdown); queued
+            # tasks still run on them after shutdown(wait=False)
+            self._retired[executor] = list((getattr(executor, "_processes", None) or {}).values())
+            executor.shutdown(wait=False)
+        self._reap(executor)
+
+    def _reap(self, executor: Executor) -> None:
+        """Kill a retired pool's workers (and the runaway task on them) once it has drained."""
+        if executor is self._executor or self._outstanding.get(executor):
+            return
+        self._outstanding.pop(executor, None)
+        for process in self._retired.pop(executor, ()):
+            process.terminate()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def stats(self) -> dict[str, int | str]:
+        running = min(self._pending, self.max_workers)
+        return {
+            "name": self.name,
+            "workers": self.max_workers,
+            "running": running,
+            "queued": self._pending - running,
+            "max_backlog": self.max_backlog,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "recycled": self.recycled,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        self._outstanding.clear()
+        for processes in self._retired.values():
+            for process in processes:
+                process.terminate()
+        self._retired.clear()
@@ -0,0 +1,115 @@
+"""Shared outbound HTTP clients: one pooled httpx.AsyncClient per purpose, per process.
+
+Each purpose (product page previews, Pushover, ...) gets its own connection limits and
+keep-alive pool, so a burst of slow retailer pages cannot starve notifications, and repeat
+calls to the same host reuse warm connections instead of paying DNS + TCP + TLS each time.
+Clients are opened in the app lifespan (or lazily on first use, e.g. in scripts) and closed
+on shutdown. HTTP/2 is used when enabled and the optional "h2" package is installed.
+"""
+
+import importlib.util
+import logging
+from dataclasses import dataclass, field
+
+import httpx
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_FETCH = "product_fetch"
+PUSHOVER = "pushover"
+
+
+@dataclass(frozen=True, slots=True)
+class HttpClientConfig:
+    max_connections: int
+    max_keepalive_connections: int
+    timeout: float = 10.0
+    follow_redirects: bool = False
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """Purpose name -> long-lived AsyncClient. Register purposes at import time; get() returns
+    the shared client (creating it if start() has not run yet).
+    """
+
+    def __init__(self, keepalive_expiry: float, http2: bool) -> None:
+        self._keepalive_expiry = keepalive_expiry
+        self._http2 = http2 and http2_available()
+        self._configs: dict[str, HttpClientConfig] = {}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def register(self, purpose: str, config: HttpClientConfig) -> None:
+        self._configs[purpose] = config
+
+    def _create(self, purpose: str) -> httpx.AsyncClient:
+        config = self._configs[purpose]
+        return httpx.AsyncClient(
+            http2=self._http2,
+            timeout=config.timeout,
+            follow_redirects=config.follow_redirects,
+            headers=config.headers,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=self._keepalive_expiry,
+            ),
+        )
+
+    def get(self, purpose: str) -> httpx.AsyncClient:
+        """Shared client for purpose. Raises KeyError for an unregistered purpose."""
+        client = self._clients.get(purpose)
+        if client is None or client.is_closed:
+            client = self._clients[purpose] = self._create(purpose)
+        return client
+
+    def start(self) -> None:
+        """Open every registered client up front (connections themselves are made on demand)."""
+        for purpose in self._configs:
+            self.get(purpose)
+        logger.info("Outbound HTTP clients ready: %s (http2=%s)", ", ".join(self._configs), self._http2)
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for purpose, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Closing HTTP client %s failed: %s", purpose, e)
+
+    def stats(self) -> dict[str, dict[str, int | bool]]:
+        return {
+            purpose: {
+                "open": purpose in self._clients and not self._clients[purpose].is_closed,
+                "http2": self._http2,
+                "max_connections": config.max_connections,
+                "max_keepalive_connections": config.max_keepalive_connections,
+            }
+            for purpose, config in self._configs.items()
+        }
+
+
+_settings = get_settings()
+http_clients = HttpClientRegistry(
+    keepalive_expiry=_settings.http_keepalive_expiry_seconds, http2=_settings.http2_enabled
+)
+http_clients.register(
+    PRODUCT_FETCH,
+    HttpClientConfig(
+        max_connections=_settings.product_fetch_max_connections,
+        max_keepalive_connections=_settings.product_fetch_max_keepalive,
+        timeout=10.0,
+        follow_redirects=True,
+        headers={"User-Agent": "WishlistAI/1.0 (Product preview fetcher)"},
+    ),
+)
+http_clients.register(
+    PUSHOVER,
+    HttpClientConfig(max_connections=_settings.pushover_max_connections, max_keepalive_connections=2),
+)
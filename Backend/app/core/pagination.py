@@ -0,0 +1,76 @@
+"""Keyset pagination: opaque cursors and page-size limits.
+
+A cursor is the sort key of the last row of a page (e.g. created_at + id), JSON-encoded and
+base64url'd. The next page is fetched with WHERE (sort key) > cursor, so every page costs
+the same index range scan no matter how deep the client pages.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or does not match the listing it was sent to."""
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor into len(types) values, converting each with its type
+    (datetime, UUID or str). Raises InvalidCursorError on any mismatch.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursorError("Invalid cursor")
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v) for t, v in zip(types, values)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def page_limit(limit: int | None) -> int:
+    """Requested page size clamped to [1, PAGE_SIZE_MAX]; PAGE_SIZE_DEFAULT when not given."""
+    settings = get_settings()
+    if limit is None:
+        limit = settings.page_size_default
+    return max(1, min(limit, settings.page_size_max))
+
+
+def build_page(rows: Sequence[T], limit: int, key: Callable[[T], tuple]) -> Page[T]:
+    """Turn limit + 1 fetched rows into a page; the extra row only signals that more exist."""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
@@ -1,5 +1,8 @@
-"""JWT and password hashing (Passlib). OAuth-ready structure."""
+"""JWT and password hashing (Passlib). OAuth-ready structure.
+bcrypt is slow on purpose; async handlers use the *_async variants, which run it in a bounded thread pool.
+"""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -7,9 +10,18 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
+from app.core.executors import BoundedExecutor
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+_settings = get_settings()
+password_hash_executor = BoundedExecutor(
+    "password_hash",
+    lambda workers: ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt"),
+    max_workers=_settings.password_hash_workers,
+    max_backlog=_settings.password_hash_max_backlog,
+)
+
 
 def _truncate_password_72_bytes(password: str) -> str:
     raw = password.encode("utf-8")
@@ -26,6 +38,16 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(_truncate_password_72_bytes(password))
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password off the event loop. Raises ExecutorSaturatedError when the pool backlog is full."""
+    return await password_hash_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash off the event loop. Raises ExecutorSaturatedError when the pool backlog is full."""
+    return await password_hash_executor.run(get_password_hash, password)
+
+
 def create_access_token(subject: str | int, extra_claims: dict[str, Any] | None = None) -> str:
     settings = get_settings()
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
@@ -1,4 +1,4 @@
 from app.db.base import Base
-from app.db.session import get_db, async_session_factory, engine
+from app.db.session import get_db, async_session_factory, engine, pool_stats
 
-__all__ = ["Base", "get_db", "async_session_factory", "engine"]
+__all__ = ["Base", "get_db", "async_session_factory", "engine", "pool_stats"]
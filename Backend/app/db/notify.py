@@ -0,0 +1,131 @@
+"""Postgres LISTEN/NOTIFY plumbing shared by the cross-process buses.
+
+Sending is plain SQL (SELECT pg_notify(channel, payload)) on any connection; run inside a
+transaction it is delivered only if that transaction commits. Receiving needs a connection
+that stays open and idle, so PgListener keeps one dedicated asyncpg connection outside the
+SQLAlchemy pool and reconnects when it drops.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+import asyncpg
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_PAYLOAD_BYTES = 7900
+
+
+def asyncpg_dsn(database_url: str) -> str:
+    """SQLAlchemy URL (postgresql+asyncpg://...) -> libpq-style DSN asyncpg accepts."""
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+class PgListener:
+    """One LISTEN connection per process, dispatching payloads to per-channel handlers.
+    Handlers run on the event loop and must not block. After a reconnect, notifications sent
+    while disconnected are lost, so on_reconnect callbacks are told to resynchronize.
+    """
+
+    def __init__(self, dsn: str, keepalive_seconds: float = 30.0) -> None:
+        self._dsn = dsn
+        self._keepalive = keepalive_seconds
+        self._handlers: dict[str, list[Callable[[str], None]]] = defaultdict(list)
+        self._reconnect_callbacks: list[Callable[[], None]] = []
+        self._conn: Any = None
+        self._task: asyncio.Task | None = None
+        self.connected = False
+        self.connects = 0
+        self.received = 0
+
+    def add_handler(self, channel: str, handler: Callable[[str], None]) -> None:
+        """Register before start(); channels are LISTENed on every (re)connect."""
+        self._handlers[channel].append(handler)
+
+    def on_reconnect(self, callback: Callable[[], None]) -> None:
+        self._reconnect_callbacks.append(callback)
+
+    def _dispatch(self, _conn: Any, _pid: int, channel: str, payload: str) -> None:
+        self.received += 1
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception:
+                logger.exception("NOTIFY handler for %s failed", channel)
+
+    async def _listen_once(self) -> None:
+        terminated = asyncio.Event()
+        self._conn = await asyncpg.connect(self._dsn)
+        self._conn.add_termination_listener(lambda _c: terminated.set())
+        for channel in self._handlers:
+            await self._conn.add_listener(channel, self._dispatch)
+        self.connected = True
+        self.connects += 1
+        if self.connects > 1:
+            for callback in self._reconnect_callbacks:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("PgListener reconnect callback failed")
+        # Idle connections can die silently (NAT, proxy); a periodic query surfaces it
+        while not terminated.is_set():
+            try:
+                await asyncio.wait_for(terminated.wait(), timeout=self._keepalive)
+            except asyncio.TimeoutError:
+                await self._conn.execute("SELECT 1")
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await self._listen_once()
+                delay = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("LISTEN connection failed, retrying in %.0fs: %s", delay, e)
+            finally:
+                self.connected = False
+                await self._close_conn()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    async def _close_conn(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close(timeout=2)
+            except Exception:
+                conn.terminate()
+
+    def start(self) -> None:
+        """Start listening in the background (idempotent); failures are retried, never raised."""
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._run(), name="pg-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._close_conn()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "received": self.received,
+            "channels": sorted(self._handlers),
+        }
+
+
+pg_listener = PgListener(asyncpg_dsn(get_settings().database_url))
@@ -1,17 +1,63 @@
-"""Async database session and engine."""
+"""Async database session and engine (pool sized from Settings, with checkout-wait telemetry)."""
 
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import get_settings
 from app.db.base import Base
 
+
+class PoolWaitStats:
+    """How long requests wait to get a connection out of the pool (includes pre-ping / overflow connect)."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_total += seconds
+        if seconds > self.wait_max:
+            self.wait_max = seconds
+
+
+pool_wait_stats = PoolWaitStats()
+
+
+class _TimedQueuePool(AsyncAdaptedQueuePool):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_wait_stats.timeouts += 1
+            raise
+        finally:
+            pool_wait_stats.record(time.perf_counter() - start)
+
+
 settings = get_settings()
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=settings.db_echo,
     future=True,
+    poolclass=_TimedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        # asyncpg's own cache and SQLAlchemy's prepared-statement cache; 0 for PgBouncer (transaction mode)
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 
 async_session_factory = async_sessionmaker(
@@ -23,6 +69,23 @@ async_session_factory = async_sessionmaker(
 )
 
 
+def pool_stats() -> dict[str, int | float]:
+    """Snapshot for metrics: pool occupancy plus cumulative checkout wait."""
+    pool = engine.pool
+    checkouts = pool_wait_stats.checkouts
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.db_max_overflow,
+        "checkouts": checkouts,
+        "timeouts": pool_wait_stats.timeouts,
+        "wait_avg_ms": round(pool_wait_stats.wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+        "wait_max_ms": round(pool_wait_stats.wait_max * 1000, 3),
+    }
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,11 @@ from app.db.base import Base
 
 class Item(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        # Matches list/public ordering (WHERE wishlist_id = ? ORDER BY rank, created_at, id),
+        # the keyset page condition on (rank, created_at, id) and the append lookup
+        Index("ix_items_wishlist_id_rank_created_at_id", "wishlist_id", "rank", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -19,18 +24,30 @@ class Item(Base):
     wishlist_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("wishlists.id", ondelete="CASCADE"), nullable=False
     )
-    sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Fractional rank key (app/services/ranking.py); "C" collation so Postgres compares it byte-wise
+    rank: Mapped[str] = mapped_column(String(255, collation="C"), nullable=False)
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     price: Mapped[float | None] = mapped_column(Numeric(12, 2), nullable=True)
     image_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     product_url: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     allow_contributions: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     cached_snapshot_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Denormalized from reservations; maintained by create_reservation (see scripts/backfill_item_totals.py)
+    reserved_total: Mapped[float] = mapped_column(
+        Numeric(12, 2), default=0, server_default="0", nullable=False
+    )
+    contributors_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
-    wishlist: Mapped["Wishlist"] = relationship("Wishlist", back_populates="items")
+    wishlist: Mapped["Wishlist"] = relationship("Wishlist", back_populates="items", lazy="raise")
     reservations: Mapped[list["Reservation"]] = relationship(
-        "Reservation", back_populates="item", lazy="selectin", cascade="all, delete-orphan"
+        "Reservation",
+        back_populates="item",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
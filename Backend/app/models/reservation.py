@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,10 @@ from app.db.base import Base
 
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        # Per-item reservation lists (ORDER BY created_at) and totals repair
+        Index("ix_reservations_item_id_created_at", "item_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -20,7 +24,7 @@ class Reservation(Base):
         UUID(as_uuid=True), ForeignKey("items.id", ondelete="CASCADE"), nullable=False
     )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True
     )
     guest_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     amount: Mapped[float] = mapped_column(Numeric(12, 2), nullable=False)
@@ -29,5 +33,5 @@ class Reservation(Base):
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
 
-    item: Mapped["Item"] = relationship("Item", back_populates="reservations")
-    user: Mapped["User | None"] = relationship("User", back_populates="reservations")
+    item: Mapped["Item"] = relationship("Item", back_populates="reservations", lazy="raise")
+    user: Mapped["User | None"] = relationship("User", back_populates="reservations", lazy="raise")
@@ -24,9 +24,10 @@ class User(Base):
     )
     pushover_user_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
+    # lazy="raise": services opt into eager loads explicitly; FKs cascade / SET NULL in the DB
     wishlists: Mapped[list["Wishlist"]] = relationship(
-        "Wishlist", back_populates="owner", lazy="selectin"
+        "Wishlist", back_populates="owner", lazy="raise", passive_deletes=True
     )
     reservations: Mapped[list["Reservation"]] = relationship(
-        "Reservation", back_populates="user", lazy="selectin"
+        "Reservation", back_populates="user", lazy="raise", passive_deletes=True
     )
@@ -4,7 +4,7 @@ import secrets
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,8 +33,23 @@ class Wishlist(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
+    # Last WebSocket event sequence number (bumped by the Postgres WS backplane)
+    event_seq: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0", nullable=False)
 
-    owner: Mapped["User"] = relationship("User", back_populates="wishlists")
+    owner: Mapped["User"] = relationship("User", back_populates="wishlists", lazy="raise")
     items: Mapped[list["Item"]] = relationship(
-        "Item", back_populates="wishlist", lazy="selectin", cascade="all, delete-orphan"
+        "Item",
+        back_populates="wishlist",
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+# Owner dashboard: WHERE owner_id = ? ORDER BY created_at DESC, id DESC (keyset pages)
+Index(
+    "ix_wishlists_owner_id_created_at_id",
+    Wishlist.owner_id,
+    Wishlist.created_at.desc(),
+    Wishlist.id.desc(),
+)
@@ -5,11 +5,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
+from app.core.executors import ExecutorSaturatedError
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    verify_password,
+    verify_password_async,
 )
 from app.db.session import get_db
 from app.schemas.auth import LoginRequest, RefreshRequest, Token
@@ -20,6 +21,14 @@ from app.services.user_service import create_user, get_user_by_email
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many sign-in requests, please retry shortly.",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.get("/me", response_model=UserResponse)
 async def me(user: User = Depends(get_current_user)):
     return user
@@ -41,6 +50,8 @@ async def register(
         return user
     except HTTPException:
         raise
+    except ExecutorSaturatedError:
+        raise _hashing_busy()
     except SQLAlchemyError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -54,7 +65,11 @@ async def login(
     session: AsyncSession = Depends(get_db),
 ):
     user = await get_user_by_email(session, data.email)
-    if not user or not verify_password(data.password, user.hashed_password):
+    try:
+        valid = user is not None and await verify_password_async(data.password, user.hashed_password)
+    except ExecutorSaturatedError:
+        raise _hashing_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -0,0 +1,60 @@
+"""Owner dashboard: profile, wishlists page with progress and activity in one call."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.core.pagination import InvalidCursorError, page_limit
+from app.db.session import get_db
+from app.models.user import User
+from app.schemas.dashboard import DashboardResponse, DashboardWishlist
+from app.schemas.user import UserResponse
+from app.services.reservation_service import WishlistActivity, get_wishlists_activity
+from app.services.wishlist_service import list_wishlists_by_owner
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = None,
+    since: datetime | None = None,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+):
+    """Three queries regardless of account size: the user, one aggregated page of wishlists
+    (counts and funding), and grouped activity markers for that page.
+    Pass the time of the previous visit as ?since to get new_reservations per wishlist.
+    """
+    try:
+        page = await list_wishlists_by_owner(session, user.id, limit=page_limit(limit), cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    activity = await get_wishlists_activity(session, [w.id for w in page.items], since=since)
+    wishlists = []
+    for w in page.items:
+        marker = activity.get(w.id, WishlistActivity())
+        wishlists.append(
+            DashboardWishlist(
+                id=w.id,
+                owner_id=w.owner_id,
+                title=w.title,
+                description=w.description,
+                deadline=w.deadline,
+                public_slug=w.public_slug,
+                created_at=w.created_at,
+                items_count=w.items_count,
+                reserved_total=float(w.reserved_total),
+                funded_percent=w.funded_percent,
+                last_reservation_at=marker.last_reservation_at,
+                new_reservations=marker.new_reservations,
+            )
+        )
+    return DashboardResponse(
+        user=UserResponse.model_validate(user),
+        wishlists=wishlists,
+        next_cursor=page.next_cursor,
+    )
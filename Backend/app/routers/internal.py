@@ -0,0 +1,43 @@
+"""Internal operational endpoints (pool / queue metrics). Not part of the public API.
+Enabled only when INTERNAL_METRICS_TOKEN is set; callers send it as X-Internal-Token.
+"""
+
+import hmac
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.config import get_settings
+from app.core.http_clients import http_clients
+from app.core.security import password_hash_executor
+from app.db.notify import pg_listener
+from app.db.session import pool_stats
+from app.services.invalidation import invalidation_bus
+from app.services.product_fetch import html_parse_executor, parse_stats, product_fetch_cache
+from app.services.public_cache import public_wishlist_cache
+from app.websocket.manager import manager
+
+router = APIRouter(prefix="/internal", tags=["internal"], include_in_schema=False)
+
+
+def _require_internal_token(x_internal_token: str | None = Header(None)) -> None:
+    expected = get_settings().internal_metrics_token
+    # 404 rather than 401/403 so the endpoint is invisible when disabled or probed
+    if not expected or not hmac.compare_digest(x_internal_token or "", expected):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+@router.get("/metrics", dependencies=[Depends(_require_internal_token)])
+async def metrics():
+    return {
+        "db_pool": pool_stats(),
+        "password_hash_pool": password_hash_executor.stats(),
+        "public_wishlist_cache": public_wishlist_cache.stats(),
+        "invalidation_bus": invalidation_bus.stats(),
+        "pg_listener": pg_listener.stats(),
+        "ws_backplane": manager.backplane.stats(),
+        "ws_connections": manager.stats(),
+        "http_clients": http_clients.stats(),
+        "product_fetch_cache": product_fetch_cache.stats(),
+        "html_parse_pool": {**html_parse_executor.stats(), **asdict(parse_stats)},
+    }
@@ -2,43 +2,53 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user_id
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, page_limit
 from app.db.session import get_db
-from app.models.user import User
 from app.models.wishlist import Wishlist
 from app.models.item import Item
-from app.schemas.item import ItemCreate, ItemResponse, ItemReorderRequest, ItemUpdate
+from app.schemas.item import (
+    ItemCreate,
+    ItemMoveRequest,
+    ItemReorderRequest,
+    ItemReorderResponse,
+    ItemResponse,
+    ItemUpdate,
+)
 from app.services.wishlist_service import get_wishlist_by_id
 from app.services.item_service import (
     create_item,
     delete_item,
     get_item_by_id,
     list_items_by_wishlist,
+    move_item,
+    rank_needs_rebalance,
+    rebalance_item_ranks_task,
     reorder_items,
     update_item,
 )
 from app.services.product_fetch import fetch_product
-from app.websocket.manager import manager
+from app.services.wishlist_events import notify_wishlist_changed
 
 router = APIRouter(prefix="/wishlists", tags=["items"])
 
 
-async def _get_own_wishlist(session: AsyncSession, wishlist_id: UUID, user: User) -> Wishlist:
+async def _get_own_wishlist(session: AsyncSession, wishlist_id: UUID, user_id: UUID) -> Wishlist:
     w = await get_wishlist_by_id(session, wishlist_id)
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist not found")
-    if w.owner_id != user.id:
+    if w.owner_id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your wishlist")
     return w
 
 
 async def _get_own_item(
-    session: AsyncSession, wishlist_id: UUID, item_id: UUID, user: User
+    session: AsyncSession, wishlist_id: UUID, item_id: UUID, user_id: UUID
 ) -> Item:
-    await _get_own_wishlist(session, wishlist_id, user)
+    await _get_own_wishlist(session, wishlist_id, user_id)
     item = await get_item_by_id(session, item_id)
     if not item or item.wishlist_id != wishlist_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Item not found")
@@ -48,11 +58,21 @@ async def _get_own_item(
 @router.get("/{wishlist_id}/items", response_model=list[ItemResponse])
 async def list_items(
     wishlist_id: UUID,
-    user: User = Depends(get_current_user),
+    response: Response,
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = None,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    await _get_own_wishlist(session, wishlist_id, user)
-    return await list_items_by_wishlist(session, wishlist_id)
+    """Items in list order, one page at a time; the next page's cursor is in the X-Next-Cursor header."""
+    await _get_own_wishlist(session, wishlist_id, user_id)
+    try:
+        page = await list_items_by_wishlist(session, wishlist_id, limit=page_limit(limit), cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
 
 
 def _merge_fetched_with_request(fetched, data_title, data_price, data_image_url):
@@ -68,10 +88,11 @@ def _merge_fetched_with_request(fetched, data_title, data_price, data_image_url)
 async def create_item_route(
     wishlist_id: UUID,
     data: ItemCreate,
-    user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    await _get_own_wishlist(session, wishlist_id, user)
+    await _get_own_wishlist(session, wishlist_id, user_id)
     if data.wishlist_id != wishlist_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="wishlist_id mismatch")
 
@@ -95,30 +116,58 @@ async def create_item_route(
         allow_contributions=data.allow_contributions,
         cached_snapshot_json=cached_snapshot_json,
     )
-    await manager.broadcast_to_wishlist(str(wishlist_id), {"type": "item_created", "item_id": str(item.id)})
+    if rank_needs_rebalance(item.rank):
+        background_tasks.add_task(rebalance_item_ranks_task, wishlist_id)
+    notify_wishlist_changed(background_tasks, wishlist_id, {"type": "item_created", "item_id": str(item.id)})
     return item
 
 
-@router.patch("/{wishlist_id}/items/reorder", status_code=status.HTTP_204_NO_CONTENT)
+@router.patch("/{wishlist_id}/items/reorder", response_model=ItemReorderResponse)
 async def reorder_items_route(
     wishlist_id: UUID,
     data: ItemReorderRequest,
-    user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db),
+):
+    await _get_own_wishlist(session, wishlist_id, user_id)
+    try:
+        item_ids = await reorder_items(session, wishlist_id, data.item_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    notify_wishlist_changed(background_tasks, wishlist_id, {"type": "items_reordered"})
+    return ItemReorderResponse(item_ids=item_ids)
+
+
+@router.patch("/{wishlist_id}/items/{item_id}/move", response_model=ItemResponse)
+async def move_item_route(
+    wishlist_id: UUID,
+    item_id: UUID,
+    data: ItemMoveRequest,
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    await _get_own_wishlist(session, wishlist_id, user)
-    await reorder_items(session, wishlist_id, data.item_ids)
-    await manager.broadcast_to_wishlist(str(wishlist_id), {"type": "items_reordered"})
+    """Drag-and-drop move: only the moved item's rank is rewritten."""
+    item = await _get_own_item(session, wishlist_id, item_id, user_id)
+    try:
+        await move_item(session, wishlist_id, item, after_id=data.after_id, before_id=data.before_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if rank_needs_rebalance(item.rank):
+        background_tasks.add_task(rebalance_item_ranks_task, wishlist_id)
+    notify_wishlist_changed(background_tasks, wishlist_id, {"type": "items_reordered"})
+    return item
 
 
 @router.get("/{wishlist_id}/items/{item_id}", response_model=ItemResponse)
 async def get_item(
     wishlist_id: UUID,
     item_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    return await _get_own_item(session, wishlist_id, item_id, user)
+    return await _get_own_item(session, wishlist_id, item_id, user_id)
 
 
 @router.patch("/{wishlist_id}/items/{item_id}", response_model=ItemResponse)
@@ -126,10 +175,11 @@ async def update_item_route(
     wishlist_id: UUID,
     item_id: UUID,
     data: ItemUpdate,
-    user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    item = await _get_own_item(session, wishlist_id, item_id, user)
+    item = await _get_own_item(session, wishlist_id, item_id, user_id)
     kwargs = data.model_dump(exclude_unset=True)
 
     # If product_url is being set/updated, refetch and cache snapshot
@@ -146,7 +196,7 @@ async def update_item_route(
         kwargs["cached_snapshot_json"] = None
 
     await update_item(session, item, **kwargs)
-    await manager.broadcast_to_wishlist(str(wishlist_id), {"type": "item_updated", "item_id": str(item_id)})
+    notify_wishlist_changed(background_tasks, wishlist_id, {"type": "item_updated", "item_id": str(item_id)})
     return item
 
 
@@ -154,9 +204,10 @@ async def update_item_route(
 async def delete_item_route(
     wishlist_id: UUID,
     item_id: UUID,
-    user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    item = await _get_own_item(session, wishlist_id, item_id, user)
+    item = await _get_own_item(session, wishlist_id, item_id, user_id)
     await delete_item(session, item)
-    await manager.broadcast_to_wishlist(str(wishlist_id), {"type": "item_deleted", "item_id": str(item_id)})
+    notify_wishlist_changed(background_tasks, wishlist_id, {"type": "item_deleted", "item_id": str(item_id)})
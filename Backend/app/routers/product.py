@@ -1,9 +1,10 @@
 """Product URL fetch: preview endpoint (OpenGraph parse). Fallback to manual input if parsing fails."""
 
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import get_current_user_id
 from app.schemas.product import ProductFetchRequest, ProductFetchResponse
 from app.services.product_fetch import fetch_product
 
@@ -13,7 +14,7 @@ router = APIRouter(prefix="/product", tags=["product"])
 @router.post("/fetch", response_model=ProductFetchResponse)
 async def fetch_product_preview(
     data: ProductFetchRequest,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
 ):
     """
     Fetch product URL and parse og:title, og:image, product:price:amount.
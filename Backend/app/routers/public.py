@@ -1,17 +1,20 @@
 """Public routes: wishlist by slug (no login required).
 Owner must NOT see who reserved or contributed — only reserved_total and contributors_count.
+Responses are served from an in-process cache of serialized pages with strong ETags.
 """
 
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 from app.db.session import get_db
-from app.services.wishlist_service import get_wishlist_by_slug
-from app.services.reservation_service import total_reserved_for_item, contributors_count_for_item
+from app.models.item import Item
+from app.models.wishlist import Wishlist
+from app.services.public_cache import etag_matches, public_wishlist_cache
+from app.services.wishlist_service import get_public_wishlist_with_totals
 
 router = APIRouter(prefix="/public", tags=["public"])
 
@@ -41,22 +44,9 @@ class PublicWishlistResponse(BaseModel):
     items: list[ItemPublic]
 
 
-@router.get("/wishlists/by-slug/{slug}", response_model=PublicWishlistResponse)
-async def get_wishlist_by_slug_public(
-    slug: str,
-    session: AsyncSession = Depends(get_db),
-):
-    w = await get_wishlist_by_slug(session, slug, load_items=True)
-    if not w:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Wishlist not found",
-        )
+def _public_response(w: Wishlist, items: list[Item]) -> PublicWishlistResponse:
     items_out = []
-    sorted_items = sorted(w.items, key=lambda i: (getattr(i, "sort_order", 0), i.created_at))
-    for item in sorted_items:
-        total = await total_reserved_for_item(session, item.id)
-        count = await contributors_count_for_item(session, item.id)
+    for item in items:
         items_out.append(
             ItemPublic(
                 id=item.id,
@@ -68,8 +58,8 @@ async def get_wishlist_by_slug_public(
                 allow_contributions=item.allow_contributions,
                 cached_snapshot_json=item.cached_snapshot_json,
                 created_at=item.created_at,
-                reserved_total=float(total),
-                contributors_count=count,
+                reserved_total=float(item.reserved_total),
+                contributors_count=item.contributors_count,
             )
         )
     return PublicWishlistResponse(
@@ -82,3 +72,28 @@ async def get_wishlist_by_slug_public(
         created_at=w.created_at,
         items=items_out,
     )
+
+
+@router.get("/wishlists/by-slug/{slug}", response_model=PublicWishlistResponse)
+async def get_wishlist_by_slug_public(
+    slug: str,
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_db),
+):
+    entry = public_wishlist_cache.get(slug)
+    if entry is None:
+        read_version = public_wishlist_cache.version
+        found = await get_public_wishlist_with_totals(session, slug)
+        if not found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Wishlist not found",
+            )
+        w, items = found
+        body = _public_response(w, items).model_dump_json().encode()
+        entry = public_wishlist_cache.put(slug, w.id, body, read_version=read_version)
+    # no-cache: clients and proxies may store the page but must revalidate (cheap 304)
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
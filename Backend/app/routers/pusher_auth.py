@@ -7,9 +7,9 @@ import logging
 from fastapi import APIRouter, Depends, Form, HTTPException, status
 from pydantic import BaseModel
 
-from app.api.deps import get_current_user_optional
+from app.api.deps import get_current_principal_optional
 from app.core.config import get_settings
-from app.models.user import User
+from app.services.user_service import Principal
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +47,7 @@ async def pusher_auth(
     socket_id: str = Form(..., min_length=1, description="Pusher socket_id"),
     channel_name: str = Form(..., min_length=1, description="Channel name (e.g. private-wishlist-123)"),
     channel_data: str | None = Form(None, description="JSON string for presence channel_data"),
-    user: User | None = Depends(get_current_user_optional),
+    user: Principal | None = Depends(get_current_principal_optional),
 ) -> PusherAuthResponse:
     settings = get_settings()
     if not settings.pusher_key or not settings.pusher_secret:
@@ -1,5 +1,6 @@
 """Reservations router. Owner must NOT see reservation identities.
-Transaction-safe reservation logic; WebSocket broadcast after commit (item_reserved / contribution_added).
+Transaction-safe reservation logic; WebSocket broadcast after commit (item_reserved / contribution_added),
+as a delta: the new reservation and the item's totals, never the item's whole reservation list.
 """
 
 from uuid import UUID
@@ -7,25 +8,26 @@ from uuid import UUID
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_current_user_optional
+from app.api.deps import get_current_user_id, get_current_user_id_optional
 from app.db.session import get_db
-from app.models.user import User
 from app.models.wishlist import Wishlist
 from app.models.reservation import Reservation
 from app.schemas.reservation import (
     ReservationCreate,
     ReservationResponseForGuest,
     ItemReservationsSummary,
+    ItemReservationsSummaryEntry,
+    WishlistReservationsSummary,
 )
 from app.services.wishlist_service import get_wishlist_by_id
 from app.services.item_service import get_item_by_id
-from app.services.user_service import get_user_by_id
+from app.services.user_service import get_principal
 from app.services.pushover import send_pushover
+from app.services.wishlist_events import notify_wishlist_changed
 from app.services.reservation_service import (
+    ReservationBusyError,
     create_reservation as svc_create_reservation,
-    list_reservations_for_item,
-    total_reserved_for_item,
-    contributors_count_for_item,
+    list_item_totals_for_wishlist,
 )
 from app.websocket.manager import manager
 
@@ -68,17 +70,14 @@ async def _send_pushover_for_reservation(
     await send_pushover(pushover_user_key, title, message)
 
 
-def _anonymized_reservations_for_broadcast(reservations: list[Reservation]) -> list[dict]:
-    """Item state for WebSocket: no user_id, no guest_name."""
-    return [
-        {
-            "id": str(r.id),
-            "amount": float(r.amount),
-            "is_full_reservation": r.is_full_reservation,
-            "created_at": r.created_at,
-        }
-        for r in reservations
-    ]
+def _reservation_for_broadcast(r: Reservation) -> dict:
+    """Reservation for WebSocket: no user_id, no guest_name."""
+    return {
+        "id": str(r.id),
+        "amount": float(r.amount),
+        "is_full_reservation": r.is_full_reservation,
+        "created_at": r.created_at,
+    }
 
 
 @router.post(
@@ -91,11 +90,12 @@ async def create_reservation(
     item_id: UUID,
     data: ReservationCreate,
     background_tasks: BackgroundTasks,
-    user: User | None = Depends(get_current_user_optional),
+    user_id: UUID | None = Depends(get_current_user_id_optional),
     session: AsyncSession = Depends(get_db),
 ):
-    """Create reservation (logged-in or guest). Transaction-safe: single DB transaction prevents double reserve.
-    Broadcasts item_reserved or contribution_added after commit, with updated item state (no user identity).
+    """Create reservation (logged-in or guest). Transaction-safe: per-item row lock prevents over-funding.
+    Broadcasts item_reserved or contribution_added after commit: the new reservation, the item's
+    totals and version (no user identity). Costs no query beyond the reservation itself.
     """
     w, item = await _get_wishlist_and_item(session, wishlist_id, item_id)
     if not w or not item:
@@ -105,34 +105,31 @@ async def create_reservation(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Item does not allow partial contributions",
         )
+    # Look up the owner before reserving: the item row stays locked until commit
+    owner = await get_principal(session, w.owner_id)
     try:
         reservation = await svc_create_reservation(
             session,
             item_id=item_id,
             amount=data.amount,
             is_full_reservation=data.is_full_reservation,
-            user_id=user.id if user else None,
+            user_id=user_id,
             guest_name=data.guest_name,
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    total = await total_reserved_for_item(session, item_id)
-    reservations = await list_reservations_for_item(session, item_id)
-    count = await contributors_count_for_item(session, item_id)
+    except ReservationBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
     event_type = "item_reserved" if data.is_full_reservation else "contribution_added"
-    payload = manager.build_item_state_event(
+    # item's totals were set from the reserving UPDATE ... RETURNING (see reservation_service)
+    payload = manager.build_reservation_event(
         event_type=event_type,
         item_id=str(item_id),
-        reserved_total=float(total),
-        contributors_count=count,
-        reservations=_anonymized_reservations_for_broadcast(reservations),
+        reserved_total=float(item.reserved_total),
+        contributors_count=item.contributors_count,
+        reservation=_reservation_for_broadcast(reservation),
     )
-    background_tasks.add_task(
-        manager.broadcast_to_wishlist,
-        str(wishlist_id),
-        payload,
-    )
-    owner = await get_user_by_id(session, w.owner_id)
+    notify_wishlist_changed(background_tasks, wishlist_id, payload)
     if owner and owner.pushover_user_key:
         background_tasks.add_task(
             _send_pushover_for_reservation,
@@ -151,15 +148,43 @@ async def create_reservation(
 async def list_reservations(
     wishlist_id: UUID,
     item_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
     """Owner sees only reserved_total and contributors_count (no identities)."""
     w, item = await _get_wishlist_and_item(session, wishlist_id, item_id)
     if not w or not item:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist or item not found")
-    if w.owner_id != user.id:
+    if w.owner_id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your wishlist")
-    total = await total_reserved_for_item(session, item_id)
-    count = await contributors_count_for_item(session, item_id)
-    return ItemReservationsSummary(reserved_total=float(total), contributors_count=count)
+    return ItemReservationsSummary(
+        reserved_total=float(item.reserved_total), contributors_count=item.contributors_count
+    )
+
+
+@router.get(
+    "/{wishlist_id}/reservations/summary",
+    response_model=WishlistReservationsSummary,
+)
+async def list_reservations_summary(
+    wishlist_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    session: AsyncSession = Depends(get_db),
+):
+    """Owner sees reserved_total and contributors_count of every item at once (no identities)."""
+    w = await get_wishlist_by_id(session, wishlist_id)
+    if not w:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist not found")
+    if w.owner_id != user_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your wishlist")
+    totals = await list_item_totals_for_wishlist(session, wishlist_id)
+    return WishlistReservationsSummary(
+        items=[
+            ItemReservationsSummaryEntry(
+                item_id=item_id,
+                reserved_total=float(reserved_total),
+                contributors_count=contributors_count,
+            )
+            for item_id, reserved_total, contributors_count in totals
+        ]
+    )
@@ -6,7 +6,7 @@ from app.api.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
-from app.services.user_service import get_user_by_id
+from app.services.user_service import update_user
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -25,10 +25,6 @@ async def update_me(
     session: AsyncSession = Depends(get_db),
 ):
     """Update current user (name and/or Pushover user key)."""
-    if data.name is not None:
-        user.name = data.name
-    if data.pushover_user_key is not None:
-        user.pushover_user_key = data.pushover_user_key.strip() or None
-    await session.flush()
-    await session.refresh(user)
-    return user
+    return await update_user(
+        session, user, name=data.name, pushover_user_key=data.pushover_user_key
+    )
@@ -2,11 +2,11 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user_id
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError, page_limit
 from app.db.session import get_db
-from app.models.user import User
 from app.models.wishlist import Wishlist
 from app.schemas.wishlist import (
     WishlistCreate,
@@ -26,21 +26,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 router = APIRouter(prefix="/wishlists", tags=["wishlists"])
 
 
-async def _get_own_wishlist(session: AsyncSession, wishlist_id: UUID, user: User) -> Wishlist:
+async def _get_own_wishlist(session: AsyncSession, wishlist_id: UUID, user_id: UUID) -> Wishlist:
     w = await get_wishlist_by_id(session, wishlist_id)
     if not w:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wishlist not found")
-    if w.owner_id != user.id:
+    if w.owner_id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your wishlist")
     return w
 
 
 @router.get("", response_model=list[WishlistListResponse])
 async def list_my_wishlists(
-    user: User = Depends(get_current_user),
+    response: Response,
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = None,
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    wishlists = await list_wishlists_by_owner(session, user.id, load_items=True)
+    """Newest first, one page at a time; the next page's cursor is in the X-Next-Cursor header."""
+    try:
+        page = await list_wishlists_by_owner(session, user_id, limit=page_limit(limit), cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
     return [
         WishlistListResponse(
             id=w.id,
@@ -50,20 +59,22 @@ async def list_my_wishlists(
             deadline=w.deadline,
             public_slug=w.public_slug,
             created_at=w.created_at,
-            items_count=len(w.items),
+            items_count=w.items_count,
+            reserved_total=float(w.reserved_total),
+            funded_percent=w.funded_percent,
         )
-        for w in wishlists
+        for w in page.items
     ]
 
 
 @router.post("", response_model=WishlistResponse, status_code=status.HTTP_201_CREATED)
 async def create_wishlist(
     data: WishlistCreate,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
     w = await svc_create(
-        session, user.id, data.title, data.description, data.deadline
+        session, user_id, data.title, data.description, data.deadline
     )
     return w
 
@@ -71,10 +82,10 @@ async def create_wishlist(
 @router.get("/{wishlist_id}", response_model=WishlistResponse)
 async def get_wishlist(
     wishlist_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    w = await _get_own_wishlist(session, wishlist_id, user)
+    w = await _get_own_wishlist(session, wishlist_id, user_id)
     return w
 
 
@@ -82,10 +93,10 @@ async def get_wishlist(
 async def update_wishlist(
     wishlist_id: UUID,
     data: WishlistUpdate,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    w = await _get_own_wishlist(session, wishlist_id, user)
+    w = await _get_own_wishlist(session, wishlist_id, user_id)
     kwargs = data.model_dump(exclude_unset=True)
     await svc_update(session, w, **kwargs)
     return w
@@ -94,8 +105,8 @@ async def update_wishlist(
 @router.delete("/{wishlist_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_my_wishlist(
     wishlist_id: UUID,
-    user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
-    w = await _get_own_wishlist(session, wishlist_id, user)
+    w = await _get_own_wishlist(session, wishlist_id, user_id)
     await delete_wishlist(session, w)
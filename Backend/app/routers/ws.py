@@ -6,28 +6,87 @@ reservation hints), add an authenticated endpoint such as:
   /ws/wishlist/{wishlist_id}/owner  (require JWT, verify owner_id).
 """
 
+import json
+import logging
 from uuid import UUID
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
+from app.db.session import async_session_factory
+from app.services.item_service import get_item_by_id
+from app.services.reservation_service import list_reservations_for_item
 from app.websocket.manager import manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/ws", tags=["websocket"])
 
 
+async def _item_state_event(wishlist_id: UUID, item_id: UUID) -> dict | None:
+    """Full anonymous state of one item, for a client whose reservation deltas have a gap.
+    Totals and version are derived from the listed rows so they always agree with the list.
+    """
+    async with async_session_factory() as session:
+        item = await get_item_by_id(session, item_id)
+        if item is None or item.wishlist_id != wishlist_id:
+            return None
+        reservations = await list_reservations_for_item(session, item_id)
+    return manager.build_item_state_event(
+        item_id=str(item_id),
+        reserved_total=float(sum(r.amount for r in reservations)),
+        contributors_count=len(reservations),
+        reservations=[
+            {
+                "id": str(r.id),
+                "amount": float(r.amount),
+                "is_full_reservation": r.is_full_reservation,
+                "created_at": r.created_at,
+            }
+            for r in reservations
+        ],
+    )
+
+
+def _resync_item_id(data: str) -> UUID | None:
+    """Item id of a {"type": "resync", "item_id": ...} client message, else None."""
+    try:
+        message = json.loads(data)
+        if message.get("type") == "resync":
+            return UUID(str(message["item_id"]))
+    except (ValueError, TypeError, KeyError, AttributeError):
+        pass
+    return None
+
+
 @router.websocket("/wishlist/{wishlist_id}")
-async def websocket_wishlist(websocket: WebSocket, wishlist_id: UUID):
+async def websocket_wishlist(
+    websocket: WebSocket,
+    wishlist_id: UUID,
+    last_seq: int | None = Query(None, ge=0),
+):
     """Subscribe to real-time updates for a wishlist (items, reservations).
-    Events: item_reserved, contribution_added (updated item state, no user identity).
+    Events: item_reserved, contribution_added (the new reservation plus the item's totals and
+    version, no user identity). A client that sees a version gap sends
+    {"type": "resync", "item_id": ...} and gets that item's full state back as item_state.
+    Every event has a per-wishlist "seq". Reconnect with ?last_seq=<last seq seen> to get the
+    missed events replayed, or {"type": "resync", "seq": N} when the client must refetch.
     """
-    key = str(wishlist_id)
-    await manager.connect(websocket, key)
+    subscriber = await manager.connect(websocket, str(wishlist_id), last_seq=last_seq)
     try:
         while True:
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_text('{"type":"pong"}')
+                # Through the queue: the writer task is the only one sending on this socket
+                subscriber.send('{"type":"pong"}')
+            elif (item_id := _resync_item_id(data)) is not None:
+                try:
+                    event = await _item_state_event(wishlist_id, item_id)
+                except Exception as e:
+                    logger.warning("Item state for resync of %s failed: %s", item_id, e)
+                    continue
+                if event is not None:
+                    subscriber.send(json.dumps(event))
     except WebSocketDisconnect:
         pass
     finally:
-        manager.disconnect(websocket, key)
+        manager.disconnect(subscriber)
@@ -0,0 +1,23 @@
+"""Owner dashboard schema: everything the home screen renders, in one response."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from app.schemas.user import UserResponse
+from app.schemas.wishlist import WishlistListResponse
+
+
+class DashboardWishlist(WishlistListResponse):
+    """List row plus anonymous activity markers (no contributor identities)."""
+
+    last_reservation_at: datetime | None = None
+    # Reservations created after the request's ?since (0 when since is omitted)
+    new_reservations: int = 0
+
+
+class DashboardResponse(BaseModel):
+    user: UserResponse
+    wishlists: list[DashboardWishlist]
+    # Pass back as ?cursor= for the next page of wishlists (null on the last page)
+    next_cursor: str | None = None
@@ -31,7 +31,7 @@ class ItemUpdate(BaseModel):
 class ItemResponse(ItemBase):
     id: UUID
     wishlist_id: UUID
-    sort_order: int = 0
+    rank: str
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -39,3 +39,14 @@ class ItemResponse(ItemBase):
 
 class ItemReorderRequest(BaseModel):
     item_ids: list[UUID]
+
+
+class ItemReorderResponse(BaseModel):
+    item_ids: list[UUID]
+
+
+class ItemMoveRequest(BaseModel):
+    """Neighbours after the move: after_id precedes the item (None = first), before_id follows it (None = last)."""
+
+    after_id: UUID | None = None
+    before_id: UUID | None = None
@@ -53,3 +53,13 @@ class ItemReservationsSummary(BaseModel):
 
     reserved_total: float
     contributors_count: int
+
+
+class ItemReservationsSummaryEntry(ItemReservationsSummary):
+    item_id: UUID
+
+
+class WishlistReservationsSummary(BaseModel):
+    """For owner: totals of every item of a wishlist (list order), no identities."""
+
+    items: list[ItemReservationsSummaryEntry]
@@ -32,9 +32,12 @@ class WishlistResponse(WishlistBase):
 
 
 class WishlistListResponse(WishlistResponse):
-    """Wishlist with item count for list views."""
+    """Wishlist with item count and funding progress for list views."""
 
     items_count: int = 0
+    reserved_total: float = 0
+    # Percent of the priced items' total that is reserved (None if no item has a price)
+    funded_percent: float | None = None
 
 
 class WishlistPublicResponse(WishlistResponse):
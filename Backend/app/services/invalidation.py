@@ -0,0 +1,163 @@
+"""Cache invalidation bus: keeps every worker's in-process caches coherent.
+
+Services call mark_changed(session, key) while writing. When that session commits, the keys
+are dispatched to this process's subscribers and, with the Postgres backend, sent to every
+other process through a NOTIFY issued inside the same transaction (so a rolled-back write
+never invalidates anything, and a committed one always does).
+
+Keys are "<kind>:<id>" strings (wishlist_key, principal_key). ALL_KEYS ("*") means "drop
+everything": sent after the LISTEN connection reconnects, since notifications may have been
+missed meanwhile.
+"""
+
+import json
+import logging
+import uuid
+from collections.abc import Callable, Iterable
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.notify import NOTIFY_MAX_PAYLOAD_BYTES, pg_listener
+
+logger = logging.getLogger(__name__)
+
+ALL_KEYS = "*"
+_PENDING = "invalidate_keys"  # session.info slot
+
+
+def wishlist_key(wishlist_id: UUID) -> str:
+    return f"wishlist:{wishlist_id}"
+
+
+def principal_key(user_id: UUID) -> str:
+    return f"principal:{user_id}"
+
+
+def mark_changed(session, *keys: str) -> None:
+    """Queue keys for invalidation when session (sync or async) commits; dropped on rollback."""
+    info = session.info
+    info.setdefault(_PENDING, set()).update(keys)
+
+
+class InMemoryInvalidationBus:
+    """Single-process bus (tests, one worker): commits are dispatched to local subscribers only."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[Callable[[str], None]] = []
+        self.published = 0
+        self.received = 0
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        """callback(key) runs on the event loop for every invalidated key; must not block."""
+        self._subscribers.append(callback)
+
+    def dispatch(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            for callback in self._subscribers:
+                try:
+                    callback(key)
+                except Exception:
+                    logger.exception("Invalidation subscriber failed for %s", key)
+
+    def publish_in_transaction(self, session: Session, keys: set[str]) -> None:
+        """Hook run just before commit, inside the transaction; nothing to send here."""
+        self.published += len(keys)
+
+    async def start(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, int | str]:
+        return {"backend": "memory", "published": self.published, "received": self.received}
+
+
+class PostgresInvalidationBus(InMemoryInvalidationBus):
+    """Cross-process bus over LISTEN/NOTIFY. The publishing process dispatches locally on
+    commit and ignores its own echo (payloads carry an origin id).
+    """
+
+    channel = "cache_invalidation"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.origin = uuid.uuid4().hex
+
+    def publish_in_transaction(self, session: Session, keys: set[str]) -> None:
+        for payload in self._payloads(sorted(keys)):
+            session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": payload},
+            )
+        self.published += len(keys)
+
+    def _payloads(self, keys: list[str]) -> Iterable[str]:
+        """Split keys into NOTIFY-sized JSON payloads."""
+        batch: list[str] = []
+        for key in keys:
+            candidate = json.dumps({"o": self.origin, "k": batch + [key]})
+            if batch and len(candidate.encode()) > NOTIFY_MAX_PAYLOAD_BYTES:
+                yield json.dumps({"o": self.origin, "k": batch})
+                batch = []
+            batch.append(key)
+        if batch:
+            yield json.dumps({"o": self.origin, "k": batch})
+
+    def _on_notify(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            origin, keys = message["o"], message["k"]
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed invalidation payload: %.200s", payload)
+            return
+        if origin == self.origin:
+            return
+        self.received += len(keys)
+        self.dispatch(keys)
+
+    async def start(self) -> None:
+        """Register with pg_listener; the caller starts the listener."""
+        pg_listener.add_handler(self.channel, self._on_notify)
+        pg_listener.on_reconnect(lambda: self.dispatch([ALL_KEYS]))
+
+    def stats(self) -> dict[str, int | str]:
+        return {**super().stats(), "backend": "postgres"}
+
+
+def _create_bus() -> InMemoryInvalidationBus:
+    backend = get_settings().invalidation_backend
+    if backend == "memory":
+        return InMemoryInvalidationBus()
+    if backend == "postgres":
+        return PostgresInvalidationBus()
+    raise ValueError(f"Unknown INVALIDATION_BACKEND {backend!r} (expected postgres or memory)")
+
+
+invalidation_bus = _create_bus()
+
+
+# Savepoints (begin_nested) fire these events too; only the outermost transaction counts.
+# Keys marked inside a rolled-back savepoint are still sent: a spurious invalidation is harmless.
+
+
+@event.listens_for(Session, "before_commit")
+def _send_pending(session: Session) -> None:
+    keys = session.info.get(_PENDING)
+    if keys and not session.in_nested_transaction():
+        invalidation_bus.publish_in_transaction(session, keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    keys = session.info.pop(_PENDING, None)
+    if keys:
+        invalidation_bus.dispatch(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    if not session.in_nested_transaction():
+        session.info.pop(_PENDING, None)
@@ -1,12 +1,22 @@
-"""Item service (async)."""
+"""Item service (async). Items are ordered by fractional rank keys (see app/services/ranking.py)."""
 
+import logging
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import String, column, func, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import get_settings
+from app.core.pagination import Page, build_page, decode_cursor
+from app.db.session import async_session_factory
 from app.models.item import Item
+from app.services.invalidation import mark_changed, wishlist_key
+from app.services.ranking import generate_key_between, generate_n_keys_between
+
+logger = logging.getLogger(__name__)
 
 
 async def get_item_by_id(
@@ -19,22 +29,38 @@ async def get_item_by_id(
     return result.scalar_one_or_none()
 
 
-async def list_items_by_wishlist(session: AsyncSession, wishlist_id: UUID) -> list[Item]:
-    result = await session.execute(
+async def list_items_by_wishlist(
+    session: AsyncSession, wishlist_id: UUID, *, limit: int, cursor: str | None = None
+) -> Page[Item]:
+    """One page of items in list order, keyset-paginated on (rank, created_at, id).
+    Raises InvalidCursorError for a bad cursor.
+    """
+    q = (
         select(Item)
         .where(Item.wishlist_id == wishlist_id)
-        .order_by(Item.sort_order, Item.created_at)
+        .order_by(Item.rank, Item.created_at, Item.id)
+        .limit(limit + 1)
     )
-    return list(result.scalars().all())
+    if cursor:
+        rank, created_at, item_id = decode_cursor(cursor, str, datetime, UUID)
+        q = q.where(tuple_(Item.rank, Item.created_at, Item.id) > (rank, created_at, item_id))
+    result = await session.execute(q)
+    return build_page(list(result.scalars().all()), limit, key=lambda i: (i.rank, i.created_at, i.id))
 
 
-async def get_next_sort_order(session: AsyncSession, wishlist_id: UUID) -> int:
+async def get_last_rank(session: AsyncSession, wishlist_id: UUID) -> str | None:
+    """Highest rank in the wishlist: one index probe on (wishlist_id, rank), no scan."""
     r = await session.execute(
-        select(func.coalesce(func.max(Item.sort_order), -1) + 1).where(
-            Item.wishlist_id == wishlist_id
-        )
+        select(Item.rank)
+        .where(Item.wishlist_id == wishlist_id)
+        .order_by(Item.rank.desc())
+        .limit(1)
     )
-    return r.scalar_one() or 0
+    return r.scalar_one_or_none()
+
+
+def rank_needs_rebalance(rank: str) -> bool:
+    return len(rank) > get_settings().item_rank_rebalance_length
 
 
 async def create_item(
@@ -47,10 +73,12 @@ async def create_item(
     allow_contributions: bool = True,
     cached_snapshot_json: dict | None = None,
 ) -> Item:
-    sort_order = await get_next_sort_order(session, wishlist_id)
+    # Two concurrent appends may pick the same rank; created_at breaks the tie and
+    # move_item / rebalancing separate them later.
+    rank = generate_key_between(await get_last_rank(session, wishlist_id), None)
     item = Item(
         wishlist_id=wishlist_id,
-        sort_order=sort_order,
+        rank=rank,
         title=title,
         price=price,
         image_url=image_url,
@@ -61,6 +89,7 @@ async def create_item(
     session.add(item)
     await session.flush()
     await session.refresh(item)
+    mark_changed(session, wishlist_key(wishlist_id))
     return item
 
 
@@ -70,20 +99,136 @@ async def update_item(session: AsyncSession, item: Item, **kwargs) -> Item:
             setattr(item, k, v)
     await session.flush()
     await session.refresh(item)
+    mark_changed(session, wishlist_key(item.wishlist_id))
     return item
 
 
 async def delete_item(session: AsyncSession, item: Item) -> None:
     await session.delete(item)
     await session.flush()
+    mark_changed(session, wishlist_key(item.wishlist_id))
+
+
+async def _write_ranks(session: AsyncSession, wishlist_id: UUID, item_ids: list[UUID]) -> None:
+    """Give item_ids fresh, evenly spread ranks in that order with a single UPDATE ... FROM (VALUES ...)."""
+    if not item_ids:
+        return
+    ranks = generate_n_keys_between(None, None, len(item_ids))
+    new_order = values(
+        column("id", PG_UUID(as_uuid=True)), column("rank", String()), name="new_order"
+    ).data(list(zip(item_ids, ranks)))
+    await session.execute(
+        update(Item)
+        .where(Item.wishlist_id == wishlist_id, Item.id == new_order.c.id)
+        .values(rank=new_order.c.rank)
+        .execution_options(synchronize_session=False)
+    )
+    mark_changed(session, wishlist_key(wishlist_id))
 
 
 async def reorder_items(
     session: AsyncSession, wishlist_id: UUID, item_ids: list[UUID]
-) -> None:
-    """Set sort_order by position in item_ids (0, 1, 2, ...)."""
-    for idx, item_id in enumerate(item_ids):
-        item = await get_item_by_id(session, item_id)
-        if item and item.wishlist_id == wishlist_id:
-            item.sort_order = idx
-    await session.flush()
+) -> list[UUID]:
+    """Re-rank the whole wishlist in item_ids order with one set-based UPDATE.
+    item_ids must list every item of the wishlist exactly once; raises ValueError otherwise.
+    Returns the new order. Prefer move_item for single drag-and-drop moves.
+    """
+    if len(set(item_ids)) != len(item_ids):
+        raise ValueError("item_ids contains duplicates")
+    current = await session.execute(select(Item.id).where(Item.wishlist_id == wishlist_id))
+    if set(current.scalars().all()) != set(item_ids):
+        raise ValueError("item_ids must list every item of the wishlist exactly once")
+    await _write_ranks(session, wishlist_id, list(item_ids))
+    return list(item_ids)
+
+
+async def rebalance_item_ranks(session: AsyncSession, wishlist_id: UUID) -> int:
+    """Rewrite all ranks of a wishlist as short, evenly spaced keys, keeping the current order
+    (duplicates from concurrent appends are separated by created_at). Returns the item count.
+    """
+    result = await session.execute(
+        select(Item.id)
+        .where(Item.wishlist_id == wishlist_id)
+        .order_by(Item.rank, Item.created_at)
+        .with_for_update()
+    )
+    item_ids = list(result.scalars().all())
+    await _write_ranks(session, wishlist_id, item_ids)
+    return len(item_ids)
+
+
+async def rebalance_item_ranks_task(wishlist_id: UUID) -> None:
+    """Background task (own session/transaction): rebalance after ranks got long."""
+    try:
+        async with async_session_factory() as session:
+            async with session.begin():
+                count = await rebalance_item_ranks(session, wishlist_id)
+        logger.info("Rebalanced ranks of %d items in wishlist %s", count, wishlist_id)
+    except Exception as e:
+        logger.warning("Rank rebalance failed for wishlist %s: %s", wishlist_id, e)
+
+
+async def move_item(
+    session: AsyncSession,
+    wishlist_id: UUID,
+    item: Item,
+    *,
+    after_id: UUID | None,
+    before_id: UUID | None,
+) -> Item:
+    """Place item right after after_id and/or right before before_id (one may be None: the
+    other side is then the actual adjacent item, or the end of the list). When both are given
+    they must be adjacent. Writes only this item's row (unless tied ranks force a rebalance).
+    Raises ValueError for unknown, mis-ordered or non-adjacent neighbours.
+    """
+    if after_id is None and before_id is None:
+        raise ValueError("after_id or before_id is required")
+    if item.id in (after_id, before_id):
+        raise ValueError("Item cannot be its own neighbour")
+    neighbour_ids = [i for i in (after_id, before_id) if i is not None]
+    # Every other item of the wishlist; the moved item's current rank is irrelevant
+    others = (Item.wishlist_id == wishlist_id, Item.id != item.id)
+    bystanders = (*others, Item.id.notin_(neighbour_ids))
+
+    async def scalar(q):
+        return (await session.execute(q)).scalar()
+
+    async def bounds() -> tuple[str | None, str | None, bool]:
+        """(rank to place after, rank to place before, whether a given neighbour shares its
+        rank with another item, which makes "right after/before it" ambiguous).
+        """
+        rows = await session.execute(
+            select(Item.id, Item.rank).where(*others, Item.id.in_(neighbour_ids))
+        )
+        ranks = dict(rows.all())
+        if len(ranks) != len(neighbour_ids):
+            raise ValueError("Neighbour item not found in this wishlist")
+        lo, hi = ranks.get(after_id), ranks.get(before_id)
+        given = [r for r in (lo, hi) if r is not None]
+        tied = lo == hi or bool(
+            await scalar(select(func.count()).where(*bystanders, Item.rank.in_(given)))
+        )
+        if lo is not None and hi is not None:
+            if lo > hi:
+                raise ValueError("after_id must come before before_id")
+            between = await scalar(
+                select(func.count()).where(*bystanders, Item.rank > lo, Item.rank < hi)
+            )
+            if between:
+                raise ValueError("after_id and before_id are not adjacent")
+        elif lo is not None:
+            hi = await scalar(select(func.min(Item.rank)).where(*others, Item.rank > lo))
+        else:
+            lo = await scalar(select(func.max(Item.rank)).where(*others, Item.rank < hi))
+        return lo, hi, tied
+
+    lo, hi, tied = await bounds()
+    if tied:
+        # Equal ranks (concurrent appends): spread them out, then look again
+        await rebalance_item_ranks(session, wishlist_id)
+        lo, hi, tied = await bounds()
+    rank = generate_key_between(lo, hi)
+    if (lo is not None and rank <= lo) or (hi is not None and rank >= hi) or tied:
+        raise ValueError("Could not place the item between its neighbours")
+    await update_item(session, item, rank=rank)
+    return item
@@ -0,0 +1,90 @@
+"""Single-pass <meta> extraction for product previews.
+
+MetaTagExtractor is an html.parser.HTMLParser that records og:*, product:* and twitter:* meta
+values as the document streams in: no DOM is built and each byte is looked at once, instead
+of one tree scan per candidate attribute. It can be fed chunk by chunk and reports when the
+caller may stop reading (end of <head>, or every wanted property seen).
+
+extract_meta_bytes is the entry point for running it in a worker process: this module only
+imports the stdlib, so pool workers start cheaply.
+"""
+
+from collections.abc import Iterable
+from html.parser import HTMLParser
+
+META_PREFIXES = ("og:", "product:", "twitter:")
+
+
+def first_meta(meta: dict[str, str], *keys: str) -> str | None:
+    """Value of the first of keys present in meta."""
+    for key in keys:
+        value = meta.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+class MetaTagExtractor(HTMLParser):
+    """Collects meta[property|name] -> content (first occurrence wins, keys lower-cased).
+
+    wanted is a list of alternative-key groups, e.g. [("og:title",), ("product:price:amount",
+    "og:price:amount")]; complete becomes True once every group has a value.
+    """
+
+    def __init__(self, wanted: Iterable[Iterable[str]] = ()) -> None:
+        super().__init__(convert_charrefs=True)
+        self.meta: dict[str, str] = {}
+        self._wanted = [tuple(group) for group in wanted]
+        self.head_ended = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "meta":
+            self._handle_meta(attrs)
+        elif tag == "body":
+            self.head_ended = True
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.head_ended = True
+
+    def _handle_meta(self, attrs: list[tuple[str, str | None]]) -> None:
+        key = content = None
+        for name, value in attrs:
+            if name in ("property", "name") and value and key is None:
+                key = value.strip().lower()
+            elif name == "content":
+                content = value
+        if key is None or not key.startswith(META_PREFIXES) or key in self.meta:
+            return
+        if content and content.strip():
+            self.meta[key] = content.strip()
+
+    @property
+    def complete(self) -> bool:
+        return bool(self._wanted) and all(
+            any(key in self.meta for key in group) for group in self._wanted
+        )
+
+    @property
+    def done(self) -> bool:
+        """Nothing more worth reading: head is over or every wanted property was found."""
+        return self.head_ended or self.complete
+
+    def first(self, *keys: str) -> str | None:
+        return first_meta(self.meta, *keys)
+
+
+def extract_meta(html: str, wanted: Iterable[Iterable[str]] = ()) -> MetaTagExtractor:
+    """Run the extractor over a whole document (tests, benchmarks, already-downloaded pages)."""
+    extractor = MetaTagExtractor(wanted)
+    extractor.feed(html)
+    extractor.close()
+    return extractor
+
+
+def extract_meta_bytes(body: bytes, encoding: str) -> dict[str, str]:
+    """Decode body and extract its meta in one call; picklable in and out (process pools)."""
+    return extract_meta(body.decode(encoding, errors="replace")).meta
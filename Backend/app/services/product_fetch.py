@@ -1,11 +1,57 @@
-"""Server-side product auto-fetch: fetch URL, parse OpenGraph meta, return snapshot. Uses httpx + BeautifulSoup."""
+"""Server-side product auto-fetch: fetch URL, parse OpenGraph meta, return snapshot. Uses httpx + MetaTagExtractor.
 
+The same product link is typically fetched several times in a row (preview, then save) and by
+many users (popular retailers), so results are cached per normalized URL: snapshots for
+PRODUCT_CACHE_TTL_SECONDS, failures for the shorter PRODUCT_CACHE_NEGATIVE_TTL_SECONDS.
+Concurrent calls for one URL share a single in-flight fetch.
+
+Pages are streamed, not read whole: each chunk is decoded and fed to a single-pass meta
+extractor, and the download stops at </head> (OpenGraph/product meta live in <head>), once
+every wanted meta property has been seen, or at PRODUCT_FETCH_MAX_BYTES. Non-HTML responses
+are dropped before their body is read. Heads larger than PRODUCT_PARSE_INLINE_MAX_BYTES are
+parsed in a bounded process pool so one huge page does not stall the event loop.
+"""
+
+import asyncio
+import codecs
+import logging
+import multiprocessing
 import re
+from collections.abc import Awaitable, Callable
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
 from dataclasses import dataclass
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import httpx
-from bs4 import BeautifulSoup
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.executors import BoundedExecutor, ExecutorSaturatedError
+from app.core.http_clients import PRODUCT_FETCH, http_clients
+from app.services.meta_extractor import MetaTagExtractor, extract_meta_bytes, first_meta
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only carry attribution; dropped so links differing by them share a cache entry
+_TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "msclkid", "yclid", "ysclid", "mc_cid", "mc_eid", "_openstat", "igshid"}
+)
+_TRACKING_PREFIXES = ("utm_",)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+_HEAD_END = b"</head"
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.I)
+# Bytes buffered before picking the charset, so a <meta charset> near the top is seen
+_CHARSET_SNIFF_BYTES = 1024
+
+# Meta keys per snapshot field, most specific first; twitter:* only fills in when OpenGraph is absent
+TITLE_KEYS = ("og:title", "twitter:title")
+IMAGE_KEYS = ("og:image", "og:image:url", "og:image:secure_url", "twitter:image")
+PRICE_AMOUNT_KEYS = ("product:price:amount", "og:price:amount")
+PRICE_CURRENCY_KEYS = ("product:price:currency", "og:price:currency")
+# Once each group has a value, the rest of the page is not needed
+WANTED_META = (("og:title",), ("og:image",), PRICE_AMOUNT_KEYS, PRICE_CURRENCY_KEYS)
 
 
 @dataclass
@@ -19,13 +65,39 @@ class ProductSnapshot:
     snapshot: dict  # Full parsed meta for cached_snapshot_json
 
 
-def _get_meta_content(soup: BeautifulSoup, props: list[tuple[str, str]]) -> str | None:
-    """Get content of first matching meta tag. props: [(attr, value), ...] e.g. [("property", "og:title")]."""
-    for attr, value in props:
-        tag = soup.find("meta", attrs={attr: value})
-        if tag and tag.get("content"):
-            return tag["content"].strip()
-    return None
+def _with_scheme(url: str) -> str:
+    url = url.strip()
+    if "://" not in url:  # not urlparse().scheme: "shop.com:443/x" would parse as scheme "shop.com"
+        url = "https://" + url
+    return url
+
+
+def normalize_url(url: str) -> str | None:
+    """Cache/dedup key of a product URL: https:// added when the scheme is missing, scheme and
+    host lower-cased, default port, fragment and tracking parameters dropped, remaining query
+    parameters sorted. Only a key: the page itself is fetched from the URL as given (signed
+    or affiliate links may depend on the exact query). None if there is no usable host.
+    """
+    if not url.strip():
+        return None
+    try:
+        parts = urlsplit(_with_scheme(url))
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+    if ":" in host:  # IPv6 literal: hostname drops the brackets
+        host = f"[{host}]"
+    netloc = host if port is None or port == _DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
 
 
 def _parse_price(value: str | None) -> tuple[float | None, str | None]:
@@ -58,58 +130,218 @@ def _absolute_url(base_url: str, path: str | None) -> str | None:
         return None
 
 
-async def fetch_product(url: str, *, timeout: float = 10.0) -> ProductSnapshot | None:
+class ProductFetchCache:
+    """Normalized URL -> snapshot (positive TTL) or failure (shorter negative TTL), plus the
+    fetches currently running so concurrent callers for one URL await the same task.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float) -> None:
+        # Keyed by normalize_url(); the fetch callables load the URL the caller gave
+        self._snapshots: TTLCache[str, ProductSnapshot] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._failures: TTLCache[str, bool] = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+        self._in_flight: dict[str, asyncio.Task[ProductSnapshot | None]] = {}
+        self.fetches = 0
+        self.deduplicated = 0
+
+    async def get_or_fetch(
+        self, url: str, fetch: Callable[[], Awaitable[ProductSnapshot | None]]
+    ) -> ProductSnapshot | None:
+        snapshot = self._snapshots.get(url)
+        if snapshot is not None:
+            return snapshot
+        if url in self._failures:
+            return None
+        task = self._in_flight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_store(url, fetch))
+            self._in_flight[url] = task
+        else:
+            self.deduplicated += 1
+        # Shielded: a caller that disconnects does not cancel the fetch others are waiting on
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self, url: str, fetch: Callable[[], Awaitable[ProductSnapshot | None]]
+    ) -> ProductSnapshot | None:
+        self.fetches += 1
+        try:
+            snapshot = await fetch()
+            if snapshot is None:
+                self._failures.set(url, True)
+            else:
+                self._snapshots.set(url, snapshot)
+            return snapshot
+        finally:
+            del self._in_flight[url]
+
+    def clear(self) -> None:
+        self._snapshots.clear()
+        self._failures.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            **self._snapshots.stats(),
+            "negative_size": len(self._failures),
+            "in_flight": len(self._in_flight),
+            "fetches": self.fetches,
+            "deduplicated": self.deduplicated,
+        }
+
+
+_settings = get_settings()
+product_fetch_cache = ProductFetchCache(
+    maxsize=_settings.product_cache_size,
+    ttl=_settings.product_cache_ttl_seconds,
+    negative_ttl=_settings.product_cache_negative_ttl_seconds,
+)
+
+
+@dataclass(slots=True)
+class ParseStats:
+    """Where page heads were parsed: inline on the event loop, or offloaded to the pool."""
+
+    inline: int = 0
+    offloaded: int = 0
+
+
+parse_stats = ParseStats()
+# Heads above PRODUCT_PARSE_INLINE_MAX_BYTES are parsed in worker processes ("spawn": never fork
+# a process that is running an event loop and open sockets)
+html_parse_executor = BoundedExecutor(
+    "html_parse",
+    lambda workers: ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ),
+    max_workers=_settings.product_parse_workers,
+    max_backlog=_settings.product_parse_max_backlog,
+    recycle_on_timeout=True,
+)
+
+
+async def fetch_product(
+    url: str, *, timeout: float = 10.0, client: httpx.AsyncClient | None = None
+) -> ProductSnapshot | None:
     """
     Fetch page HTML and parse OpenGraph + product meta.
     - og:title, og:image, product:price:amount (and product:price:currency).
     Returns ProductSnapshot or None on fetch/parse failure (caller falls back to manual input).
+    Served from product_fetch_cache when the normalized URL was fetched recently; uses the
+    shared pooled client (keep-alive across calls) unless one is passed in.
     """
-    if not url or not url.strip():
+    normalized = normalize_url(url) if url else None
+    if normalized is None:
         return None
-    url = url.strip()
-    parsed = urlparse(url)
-    if not parsed.scheme:
-        url = "https://" + url
+    fetch_url = _with_scheme(url)
     try:
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            timeout=timeout,
-            headers={"User-Agent": "WishlistAI/1.0 (Product preview fetcher)"},
-        ) as client:
-            resp = await client.get(url)
-            resp.raise_for_status()
-            html = resp.text
-            base_url = str(resp.url)
-    except (httpx.HTTPError, httpx.TimeoutException, Exception):
+        return await product_fetch_cache.get_or_fetch(
+            normalized, lambda: _fetch_uncached(fetch_url, timeout=timeout, client=client)
+        )
+    except (ExecutorSaturatedError, BrokenExecutor) as e:
+        logger.warning("Parse pool unavailable, not previewing %s: %s", normalized, e)
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
 
-    # OpenGraph
-    title = _get_meta_content(soup, [("property", "og:title"), ("name", "og:title")])
-    image_url = _get_meta_content(soup, [("property", "og:image"), ("name", "og:image")])
-    if image_url:
-        image_url = _absolute_url(base_url, image_url)
+def _is_html(content_type: str | None) -> bool:
+    """Missing Content-Type is given the benefit of the doubt; anything else must be HTML."""
+    if not content_type:
+        return True
+    return content_type.split(";", 1)[0].strip().lower() in _HTML_CONTENT_TYPES
+
+
+def _pick_charset(header_charset: str | None, head: bytes) -> str:
+    """Header charset, else a <meta charset> near the top, else UTF-8 (first one Python knows)."""
+    candidates = [header_charset]
+    match = _META_CHARSET.search(head)
+    if match:
+        candidates.append(match.group(1).decode("ascii", "ignore"))
+    for charset in candidates:
+        if not charset:
+            continue
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+@dataclass(slots=True)
+class _Download:
+    """A streamed page: meta already extracted inline, or the raw head left for the parse pool."""
+
+    base_url: str
+    meta: dict[str, str] | None = None
+    body: bytes = b""
+    encoding: str = "utf-8"
+
+
+async def _download_meta(
+    client: httpx.AsyncClient, url: str, *, max_bytes: int, inline_max_bytes: int
+) -> _Download | None:
+    """Stream the page until </head>, all wanted meta, or max_bytes. The first inline_max_bytes
+    are fed to a MetaTagExtractor as they arrive, however the response is chunked (typical
+    pages finish here); only if <head> is still open past that is the rest of it collected and
+    the whole head parsed by the caller off the event loop.
+    Returns None for a non-HTML response.
+    """
+    extractor = MetaTagExtractor(WANTED_META)
+    body = bytearray()
+    fed = 0  # bytes of body already given to the extractor (or, past the inline limit, scanned)
+    encoding = None
+    decoder = None
+    inline = True
+    async with client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        if not _is_html(resp.headers.get("content-type")):
+            return None
+        async for chunk in resp.aiter_bytes():
+            body += chunk[: max_bytes - len(body)]
+            if decoder is None:
+                sniffing = not resp.charset_encoding and not _META_CHARSET.search(body)
+                if sniffing and len(body) < _CHARSET_SNIFF_BYTES and len(body) < max_bytes:
+                    continue
+                encoding = _pick_charset(resp.charset_encoding, body)
+                decoder = codecs.getincrementaldecoder(encoding)("replace")
+            if inline:
+                # Feed up to the limit even when one chunk crosses it (a decompressed gzip chunk
+                # is often larger than the whole limit): a short head still finishes inline
+                end = min(len(body), inline_max_bytes)
+                extractor.feed(decoder.decode(bytes(body[fed:end])))
+                fed = end
+                # Safe to stop mid-stream: HTMLParser holds back a tag until its closing ">",
+                # so a meta cut by a chunk boundary is neither recorded nor counted as found
+                if extractor.done:
+                    del body[fed:]
+                    break
+                inline = len(body) <= inline_max_bytes
+            if not inline:
+                # Only look for the end of <head>; bytes already fed were checked by the extractor
+                scan_from = max(0, fed - len(_HEAD_END))
+                head_end = bytes(body[scan_from:]).lower().find(_HEAD_END)
+                if head_end >= 0:
+                    del body[scan_from + head_end :]
+                    break
+                fed = len(body)
+            if len(body) >= max_bytes:
+                break
+        base_url = str(resp.url)
+    if decoder is None:  # whole page shorter than the sniff window
+        encoding = _pick_charset(resp.charset_encoding, body)
+        decoder = codecs.getincrementaldecoder(encoding)("replace")
+    if not inline:
+        return _Download(base_url, body=bytes(body), encoding=encoding)
+    extractor.feed(decoder.decode(bytes(body[fed:]), final=True))
+    extractor.close()
+    return _Download(base_url, meta=extractor.meta)
+
+
+def snapshot_from_meta(meta: dict[str, str], base_url: str) -> ProductSnapshot:
+    """Build the product snapshot from extracted og:/product:/twitter: meta."""
+    title = first_meta(meta, *TITLE_KEYS)
+    image_url = _absolute_url(base_url, first_meta(meta, *IMAGE_KEYS))
 
     # Product meta (e.g. product:price:amount, product:price:currency)
-    price_amount_str = _get_meta_content(
-        soup,
-        [
-            ("property", "product:price:amount"),
-            ("name", "product:price:amount"),
-            ("property", "og:price:amount"),
-            ("name", "og:price:amount"),
-        ],
-    )
-    price_currency_str = _get_meta_content(
-        soup,
-        [
-            ("property", "product:price:currency"),
-            ("name", "product:price:currency"),
-            ("property", "og:price:currency"),
-            ("name", "og:price:currency"),
-        ],
-    )
+    price_amount_str = first_meta(meta, *PRICE_AMOUNT_KEYS)
+    price_currency_str = first_meta(meta, *PRICE_CURRENCY_KEYS)
     price, currency = _parse_price(price_amount_str)
     if price is not None and price_currency_str and not currency:
         currency = price_currency_str.strip().upper()[:3]
@@ -131,3 +363,65 @@ async def fetch_product(url: str, *, timeout: float = 10.0) -> ProductSnapshot |
         currency=currency,
         snapshot=snapshot,
     )
+
+
+async def _parse_in_pool(download: _Download) -> dict[str, str] | None:
+    """Extract meta from a large head in html_parse_executor; None if the page failed to parse
+    in time. A page that times out has its pool retired (workers killed once the other pages in
+    it are done, so only that page is lost). Pages caught in a pool broken by a dead worker are
+    retried once on the fresh pool. ExecutorSaturatedError and a repeated BrokenExecutor
+    propagate: they are not properties of the page, so must not be cached.
+    """
+    parse_stats.offloaded += 1
+    for attempt in (1, 2):
+        try:
+            return await html_parse_executor.run(
+                extract_meta_bytes,
+                download.body,
+                download.encoding,
+                timeout=get_settings().product_parse_timeout_seconds,
+            )
+        except ExecutorSaturatedError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning("Parsing %s (%d bytes) timed out", download.base_url, len(download.body))
+            return None
+        except BrokenExecutor as e:
+            # A worker died (e.g. OOM) and took the pool down
+            if attempt == 2:
+                raise
+            logger.info("Parse pool restarted while parsing %s, retrying: %s", download.base_url, e)
+        except Exception as e:
+            logger.warning("Parsing %s failed in the parse pool: %s", download.base_url, e)
+            return None
+    return None
+
+
+async def _fetch_uncached(
+    url: str, *, timeout: float, client: httpx.AsyncClient | None
+) -> ProductSnapshot | None:
+    settings = get_settings()
+    client = client or http_clients.get(PRODUCT_FETCH)
+    try:
+        # Total deadline: a server trickling bytes must not keep the fetch alive indefinitely
+        download = await asyncio.wait_for(
+            _download_meta(
+                client,
+                url,
+                max_bytes=settings.product_fetch_max_bytes,
+                inline_max_bytes=settings.product_parse_inline_max_bytes,
+            ),
+            timeout,
+        )
+    except (httpx.HTTPError, asyncio.TimeoutError, Exception):
+        return None
+    if download is None:
+        return None
+    if download.meta is not None:
+        parse_stats.inline += 1
+        meta = download.meta
+    else:
+        meta = await _parse_in_pool(download)
+        if meta is None:
+            return None
+    return snapshot_from_meta(meta, download.base_url)
@@ -0,0 +1,88 @@
+"""Cache of serialized public wishlist pages (GET /public/wishlists/by-slug/{slug}).
+
+Entries hold the ready-to-send JSON bytes plus a strong ETag, keyed by slug. Services mark
+"wishlist:<id>" changed on write; the invalidation bus drops the entry in every worker once
+the transaction commits. The TTL only bounds staleness for changes made outside the app.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.services.invalidation import ALL_KEYS, invalidation_bus
+
+
+@dataclass(frozen=True, slots=True)
+class CachedPublicWishlist:
+    wishlist_id: UUID
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value matches etag (list of tags or "*")."""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class PublicWishlistCache:
+    """Slug -> serialized page, plus wishlist id -> slug so writers that only know the id can
+    invalidate. Every invalidation bumps a version; a reader that started before it must not
+    store what it read (it may predate the commit), see put().
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._pages: TTLCache[str, CachedPublicWishlist] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._slugs: TTLCache[UUID, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.version = 0
+        self.invalidations = 0
+
+    def get(self, slug: str) -> CachedPublicWishlist | None:
+        return self._pages.get(slug)
+
+    def put(self, slug: str, wishlist_id: UUID, body: bytes, *, read_version: int) -> CachedPublicWishlist:
+        """Build the entry; store it only if nothing was invalidated since read_version."""
+        entry = CachedPublicWishlist(wishlist_id=wishlist_id, body=body, etag=make_etag(body))
+        if read_version == self.version:
+            self._pages.set(slug, entry)
+            self._slugs.set(wishlist_id, slug)
+        return entry
+
+    def invalidate_wishlist(self, wishlist_id: UUID) -> None:
+        self.version += 1
+        self.invalidations += 1
+        slug = self._slugs.pop(wishlist_id)
+        if slug is not None:
+            self._pages.pop(slug)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._pages.clear()
+        self._slugs.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {**self._pages.stats(), "invalidations": self.invalidations}
+
+
+_settings = get_settings()
+public_wishlist_cache = PublicWishlistCache(
+    maxsize=_settings.public_cache_size, ttl=_settings.public_cache_ttl_seconds
+)
+
+
+def _on_invalidate(key: str) -> None:
+    if key == ALL_KEYS:
+        public_wishlist_cache.clear()
+    elif key.startswith("wishlist:"):
+        public_wishlist_cache.invalidate_wishlist(UUID(key.removeprefix("wishlist:")))
+
+
+invalidation_bus.subscribe(_on_invalidate)
@@ -0,0 +1,178 @@
+"""Fractional rank keys for ordering items (lexicographic strings, base 62).
+
+A key is an "integer part" (a head letter giving its length, then digits) followed by an
+optional fraction. generate_key_between(a, b) returns a key strictly between a and b
+(None = open end), so moving or appending an item writes only that item's row.
+Appends grow the integer part (a0, a1, ... az, b00, ...) and stay short; repeated inserts
+between the same two neighbours lengthen the fraction, which rebalancing resets.
+
+Keys compare correctly only with byte-wise ordering: the DB column uses COLLATE "C".
+Port of the well-known fractional-indexing algorithm (David Greenspan / Figma).
+"""
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_ZERO = DIGITS[0]
+_INTEGER_ZERO = "a" + _ZERO
+_SMALLEST_INTEGER = "A" + _ZERO * 26
+
+
+def _midpoint(a: str, b: str | None) -> str:
+    """Fraction strictly between a and b ("" = 0, None = 1). No trailing zeros allowed."""
+    if b is not None and a >= b:
+        raise ValueError(f"{a!r} >= {b!r}")
+    if a[-1:] == _ZERO or (b and b[-1:] == _ZERO):
+        raise ValueError("trailing zero")
+    if b:
+        # Shared prefix: recurse on the remainder
+        n = 0
+        while (a[n] if n < len(a) else _ZERO) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else len(DIGITS)
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    # Consecutive digits
+    if b and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"invalid rank head {head!r}")
+
+
+def _integer_part(key: str) -> str:
+    n = _integer_length(key[0])
+    if n > len(key):
+        raise ValueError(f"invalid rank key {key!r}")
+    return key[:n]
+
+
+def validate_key(key: str) -> None:
+    if not key or key == _SMALLEST_INTEGER:
+        raise ValueError(f"invalid rank key {key!r}")
+    integer = _integer_part(key)
+    if key[len(integer):][-1:] == _ZERO:
+        raise ValueError(f"invalid rank key {key!r}")
+
+
+def _increment_integer(x: str) -> str | None:
+    head, digits = x[0], list(x[1:])
+    carry = True
+    for i in reversed(range(len(digits))):
+        d = DIGITS.index(digits[i]) + 1
+        if d == len(DIGITS):
+            digits[i] = _ZERO
+        else:
+            digits[i] = DIGITS[d]
+            carry = False
+            break
+    if carry:
+        if head == "Z":
+            return "a" + _ZERO
+        if head == "z":
+            return None
+        new_head = chr(ord(head) + 1)
+        if new_head > "a":
+            digits.append(_ZERO)
+        else:
+            digits.pop()
+        return new_head + "".join(digits)
+    return head + "".join(digits)
+
+
+def _decrement_integer(x: str) -> str | None:
+    head, digits = x[0], list(x[1:])
+    borrow = True
+    for i in reversed(range(len(digits))):
+        d = DIGITS.index(digits[i]) - 1
+        if d == -1:
+            digits[i] = DIGITS[-1]
+        else:
+            digits[i] = DIGITS[d]
+            borrow = False
+            break
+    if borrow:
+        if head == "a":
+            return "Z" + DIGITS[-1]
+        if head == "A":
+            return None
+        new_head = chr(ord(head) - 1)
+        if new_head < "Z":
+            digits.append(DIGITS[-1])
+        else:
+            digits.pop()
+        return new_head + "".join(digits)
+    return head + "".join(digits)
+
+
+def generate_key_between(a: str | None, b: str | None) -> str:
+    """Key strictly between a and b; None means before everything / after everything."""
+    if a is not None:
+        validate_key(a)
+    if b is not None:
+        validate_key(b)
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"{a!r} >= {b!r}")
+    if a is None:
+        if b is None:
+            return _INTEGER_ZERO
+        ib = _integer_part(b)
+        fb = b[len(ib):]
+        if ib == _SMALLEST_INTEGER:
+            return ib + _midpoint("", fb)
+        if ib < b:
+            return ib
+        res = _decrement_integer(ib)
+        if res is None:
+            raise ValueError("cannot decrement any more")
+        return res
+    if b is None:
+        ia = _integer_part(a)
+        fa = a[len(ia):]
+        i = _increment_integer(ia)
+        return ia + _midpoint(fa, None) if i is None else i
+    ia = _integer_part(a)
+    fa = a[len(ia):]
+    ib = _integer_part(b)
+    fb = b[len(ib):]
+    if ia == ib:
+        return ia + _midpoint(fa, fb)
+    i = _increment_integer(ia)
+    if i is None:
+        raise ValueError("cannot increment any more")
+    if i < b:
+        return i
+    return ia + _midpoint(fa, None)
+
+
+def generate_n_keys_between(a: str | None, b: str | None, n: int) -> list[str]:
+    """n ascending keys strictly between a and b, as evenly spread (and short) as possible."""
+    if n == 0:
+        return []
+    if n == 1:
+        return [generate_key_between(a, b)]
+    if b is None:
+        c = generate_key_between(a, b)
+        result = [c]
+        for _ in range(n - 1):
+            c = generate_key_between(c, b)
+            result.append(c)
+        return result
+    if a is None:
+        c = generate_key_between(a, b)
+        result = [c]
+        for _ in range(n - 1):
+            c = generate_key_between(a, c)
+            result.append(c)
+        result.reverse()
+        return result
+    mid = n // 2
+    c = generate_key_between(a, b)
+    return [*generate_n_keys_between(a, c, mid), c, *generate_n_keys_between(c, b, n - mid - 1)]
@@ -1,13 +1,42 @@
 """Reservation service: transactions to prevent double reservation, no identity to owner."""
 
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select, func
+from sqlalchemy import literal, or_, select, func, text, update
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
+from app.core.config import get_settings
 from app.models.item import Item
 from app.models.reservation import Reservation
+from app.services.invalidation import mark_changed, wishlist_key
+
+logger = logging.getLogger(__name__)
+
+# serialization_failure, deadlock_detected, lock_not_available (lock_timeout)
+_RETRYABLE_SQLSTATES = {"40001", "40P01", "55P03"}
+
+
+class ReservationBusyError(Exception):
+    """Item stayed contended (lock timeout / deadlock) after all retries."""
+
+
+@dataclass(slots=True)
+class WishlistActivity:
+    """Anonymous activity marker for the owner: when the last reservation came in and how
+    many arrived after a given moment. No identities.
+    """
+
+    last_reservation_at: datetime | None = None
+    new_reservations: int = 0
 
 
 async def get_reservation_by_id(session: AsyncSession, reservation_id: UUID) -> Reservation | None:
@@ -36,23 +65,83 @@ async def contributors_count_for_item(session: AsyncSession, item_id: UUID) -> i
     return result.scalar() or 0
 
 
-async def create_reservation(
+async def list_item_totals_for_wishlist(
+    session: AsyncSession, wishlist_id: UUID
+) -> list[tuple[UUID, Decimal, int]]:
+    """(item_id, reserved_total, contributors_count) for every item of a wishlist, in list
+    order, from one narrow SELECT on the denormalized item columns (no reservation rows).
+    """
+    result = await session.execute(
+        select(Item.id, Item.reserved_total, Item.contributors_count)
+        .where(Item.wishlist_id == wishlist_id)
+        .order_by(Item.rank, Item.created_at, Item.id)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+async def get_wishlists_activity(
+    session: AsyncSession, wishlist_ids: list[UUID], *, since: datetime | None = None
+) -> dict[UUID, WishlistActivity]:
+    """Activity markers for several wishlists in one grouped query (reservations are reached
+    through the (item_id, created_at) index). Wishlists without reservations are omitted.
+    """
+    if not wishlist_ids:
+        return {}
+    new_count = (
+        func.count(Reservation.id).filter(Reservation.created_at > since)
+        if since is not None
+        else literal(0)
+    )
+    result = await session.execute(
+        select(Item.wishlist_id, func.max(Reservation.created_at), new_count)
+        .join(Reservation, Reservation.item_id == Item.id)
+        .where(Item.wishlist_id.in_(wishlist_ids))
+        .group_by(Item.wishlist_id)
+    )
+    return {
+        wishlist_id: WishlistActivity(last_reservation_at=last_at, new_reservations=count)
+        for wishlist_id, last_at, count in result.all()
+    }
+
+
+def _is_retryable(exc: DBAPIError) -> bool:
+    code = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+    return code in _RETRYABLE_SQLSTATES
+
+
+async def _reserve_once(
     session: AsyncSession,
     item_id: UUID,
-    amount: float,
-    is_full_reservation: bool = False,
-    user_id: UUID | None = None,
-    guest_name: str | None = None,
-) -> Reservation:
-    """Create reservation inside a transaction. Caller must run in transaction to avoid double reserve."""
-    item_result = await session.execute(select(Item).where(Item.id == item_id))
-    item = item_result.scalar_one_or_none()
-    if not item:
-        raise ValueError("Item not found")
-
-    total = await total_reserved_for_item(session, item_id)
-    item_price = float(item.price or 0)
-    if item_price > 0 and total + amount > item_price:
+    amount: Decimal,
+    is_full_reservation: bool,
+    user_id: UUID | None,
+    guest_name: str | None,
+) -> tuple[Reservation, Decimal, int, UUID]:
+    # Conditional UPDATE: Postgres takes the item's row lock and re-checks the price
+    # predicate against the latest committed totals, so concurrent contributors queue
+    # per item and can never push reserved_total past price.
+    totals = await session.execute(
+        update(Item)
+        .where(
+            Item.id == item_id,
+            or_(
+                Item.price.is_(None),
+                Item.price <= 0,
+                Item.reserved_total + amount <= Item.price,
+            ),
+        )
+        .values(
+            reserved_total=Item.reserved_total + amount,
+            contributors_count=Item.contributors_count + 1,
+        )
+        .returning(Item.reserved_total, Item.contributors_count, Item.wishlist_id)
+        .execution_options(synchronize_session=False)
+    )
+    row = totals.one_or_none()
+    if row is None:
+        exists = await session.execute(select(Item.id).where(Item.id == item_id))
+        if exists.scalar_one_or_none() is None:
+            raise ValueError("Item not found")
         raise ValueError("Reservation would exceed item price")
 
     reservation = Reservation(
@@ -65,4 +154,76 @@ async def create_reservation(
     session.add(reservation)
     await session.flush()
     await session.refresh(reservation)
+    return reservation, row[0], row[1], row[2]
+
+
+async def create_reservation(
+    session: AsyncSession,
+    item_id: UUID,
+    amount: float,
+    is_full_reservation: bool = False,
+    user_id: UUID | None = None,
+    guest_name: str | None = None,
+) -> Reservation:
+    """Create reservation inside the caller's transaction; Item totals are bumped in the same transaction.
+    Serializes per item (row lock via conditional UPDATE), never globally. Lock timeouts and
+    deadlocks are retried a bounded number of times inside a savepoint.
+    """
+    settings = get_settings()
+    amount_dec = Decimal(str(amount))
+    if settings.reservation_lock_timeout_ms > 0:
+        await session.execute(
+            text(f"SET LOCAL lock_timeout = {int(settings.reservation_lock_timeout_ms)}")
+        )
+    attempt = 0
+    while True:
+        try:
+            async with session.begin_nested():
+                reservation, reserved_total, contributors_count, wishlist_id = await _reserve_once(
+                    session, item_id, amount_dec, is_full_reservation, user_id, guest_name
+                )
+            break
+        except DBAPIError as e:
+            if not _is_retryable(e):
+                raise
+            attempt += 1
+            if attempt > settings.reservation_max_retries:
+                raise ReservationBusyError("Item is busy, please retry") from e
+            logger.info("create_reservation: retrying item %s after %s (attempt %d)", item_id, e.orig, attempt)
+            await asyncio.sleep(random.uniform(0, 0.05 * attempt))
+
+    mark_changed(session, wishlist_key(wishlist_id))
+    # Keep an already-loaded Item (e.g. the router's) in step with the new totals
+    item = session.identity_map.get(identity_key(Item, item_id))
+    if item is not None:
+        set_committed_value(item, "reserved_total", reserved_total)
+        set_committed_value(item, "contributors_count", contributors_count)
     return reservation
+
+
+async def recompute_item_totals(session: AsyncSession, item_id: UUID | None = None) -> int:
+    """Repair denormalized Item totals from the reservations table. All items when item_id is None.
+    Only rows that drifted are written; returns how many were fixed.
+    """
+    total_q = (
+        select(func.coalesce(func.sum(Reservation.amount), 0))
+        .where(Reservation.item_id == Item.id)
+        .scalar_subquery()
+    )
+    count_q = (
+        select(func.count(Reservation.id))
+        .where(Reservation.item_id == Item.id)
+        .scalar_subquery()
+    )
+    q = (
+        update(Item)
+        .where((Item.reserved_total != total_q) | (Item.contributors_count != count_q))
+        .values(reserved_total=total_q, contributors_count=count_q)
+        .execution_options(synchronize_session=False)
+    )
+    if item_id is not None:
+        q = q.where(Item.id == item_id)
+    result = await session.execute(q.returning(Item.wishlist_id))
+    wishlist_ids = result.scalars().all()
+    mark_changed(session, *(wishlist_key(w) for w in set(wishlist_ids)))
+    return len(wishlist_ids)
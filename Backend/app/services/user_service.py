@@ -1,13 +1,32 @@
 """User service (async)."""
 
+from dataclasses import dataclass
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.security import get_password_hash_async
 from app.models.user import User
 from app.schemas.user import UserCreate
+from app.services.invalidation import ALL_KEYS, invalidation_bus, mark_changed, principal_key
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Slim authenticated user for dependencies: no ORM state, safe to cache across requests."""
+
+    id: UUID
+    name: str
+    pushover_user_key: str | None
+
+
+_settings = get_settings()
+_principal_cache: TTLCache[UUID, Principal] = TTLCache(
+    maxsize=_settings.principal_cache_size, ttl=_settings.principal_cache_ttl_seconds
+)
 
 
 async def get_user_by_id(session: AsyncSession, user_id: UUID) -> User | None:
@@ -23,10 +42,59 @@ async def get_user_by_email(session: AsyncSession, email: str) -> User | None:
 async def create_user(session: AsyncSession, data: UserCreate) -> User:
     user = User(
         email=data.email,
-        hashed_password=get_password_hash(data.password),
+        hashed_password=await get_password_hash_async(data.password),
         name=data.name,
     )
     session.add(user)
     await session.flush()
     await session.refresh(user)
     return user
+
+
+async def get_principal(session: AsyncSession, user_id: UUID) -> Principal | None:
+    """Principal for user_id from the in-process cache, else one narrow SELECT."""
+    principal = _principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+    result = await session.execute(
+        select(User.id, User.name, User.pushover_user_key).where(User.id == user_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+    principal = Principal(id=row.id, name=row.name, pushover_user_key=row.pushover_user_key)
+    _principal_cache.set(user_id, principal)
+    return principal
+
+
+def invalidate_principal(user_id: UUID) -> None:
+    _principal_cache.pop(user_id)
+
+
+def _on_invalidate(key: str) -> None:
+    if key == ALL_KEYS:
+        _principal_cache.clear()
+    elif key.startswith("principal:"):
+        invalidate_principal(UUID(key.removeprefix("principal:")))
+
+
+invalidation_bus.subscribe(_on_invalidate)
+
+
+async def update_user(
+    session: AsyncSession,
+    user: User,
+    *,
+    name: str | None = None,
+    pushover_user_key: str | None = None,
+) -> User:
+    """Update profile fields (None = unchanged; blank pushover key clears it); the cached principal is dropped on commit."""
+    if name is not None:
+        user.name = name
+    if pushover_user_key is not None:
+        user.pushover_user_key = pushover_user_key.strip() or None
+    await session.flush()
+    await session.refresh(user)
+    # Dropped from every worker's cache once the update commits
+    mark_changed(session, principal_key(user.id))
+    return user
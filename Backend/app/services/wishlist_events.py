@@ -0,0 +1,14 @@
+"""Side effects of a wishlist change, run once the request's transaction has committed."""
+
+from uuid import UUID
+
+from fastapi import BackgroundTasks
+
+from app.websocket.manager import manager
+
+
+def notify_wishlist_changed(background_tasks: BackgroundTasks, wishlist_id: UUID, event: dict) -> None:
+    """Broadcast event to the wishlist's WS clients after get_db commits, so clients that
+    refetch see the new state (caches are already invalidated by then, see invalidation.py).
+    """
+    background_tasks.add_task(manager.broadcast_to_wishlist, str(wishlist_id), event)
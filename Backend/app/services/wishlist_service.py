@@ -1,13 +1,44 @@
 """Wishlist service (async). Slug generation, public by slug."""
 
 import secrets
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import Page, build_page, decode_cursor
+from app.models.item import Item
 from app.models.wishlist import Wishlist
+from app.services.invalidation import mark_changed, wishlist_key
+
+
+@dataclass(slots=True)
+class WishlistSummary:
+    """Owner list row: wishlist columns plus item aggregates (no ORM objects)."""
+
+    id: UUID
+    owner_id: UUID
+    title: str
+    description: str | None
+    deadline: datetime | None
+    public_slug: str
+    created_at: datetime
+    items_count: int
+    reserved_total: Decimal
+    # Sum of prices of priced items, and of reservations on them capped at each price
+    target_total: Decimal | None
+    funded_total: Decimal | None
+
+    @property
+    def funded_percent(self) -> float | None:
+        """Share of the priced items' total that is covered; None when nothing has a price."""
+        if not self.target_total:
+            return None
+        return round(float((self.funded_total or 0) * 100 / self.target_total), 1)
 
 
 def _generate_slug() -> str:
@@ -25,7 +56,7 @@ async def get_wishlist_by_id(
 
 
 async def get_wishlist_by_slug(
-    session: AsyncSession, slug: str, *, load_items: bool = True
+    session: AsyncSession, slug: str, *, load_items: bool = False
 ) -> Wishlist | None:
     q = select(Wishlist).where(Wishlist.public_slug == slug)
     if load_items:
@@ -34,18 +65,80 @@ async def get_wishlist_by_slug(
     return result.scalar_one_or_none()
 
 
+async def get_public_wishlist_with_totals(
+    session: AsyncSession, slug: str
+) -> tuple[Wishlist, list[Item]] | None:
+    """Wishlist by slug plus its ordered items in two queries regardless of item count.
+    Reservation progress is read from the denormalized Item.reserved_total / contributors_count.
+    """
+    result = await session.execute(
+        select(Wishlist).where(Wishlist.public_slug == slug)
+    )
+    wishlist = result.scalar_one_or_none()
+    if not wishlist:
+        return None
+    rows = await session.execute(
+        select(Item)
+        .where(Item.wishlist_id == wishlist.id)
+        .order_by(Item.rank, Item.created_at)
+    )
+    return wishlist, list(rows.scalars().all())
+
+
 async def list_wishlists_by_owner(
-    session: AsyncSession, owner_id: UUID, *, load_items: bool = False
-) -> list[Wishlist]:
-    q = (
-        select(Wishlist)
+    session: AsyncSession, owner_id: UUID, *, limit: int, cursor: str | None = None
+) -> Page[WishlistSummary]:
+    """One page of the owner's wishlists, newest first, with item count, reserved total and
+    funding progress, in a single statement: the page is picked on the (owner_id, created_at,
+    id) index, then only its items are aggregated (GROUP BY over Item.reserved_total, no
+    reservation rows and no ORM objects). Keyset-paginated on (created_at, id) DESC.
+    Raises InvalidCursorError for a bad cursor.
+    """
+    page_q = (
+        select(
+            Wishlist.id,
+            Wishlist.owner_id,
+            Wishlist.title,
+            Wishlist.description,
+            Wishlist.deadline,
+            Wishlist.public_slug,
+            Wishlist.created_at,
+        )
         .where(Wishlist.owner_id == owner_id)
-        .order_by(Wishlist.created_at.desc())
+        .order_by(Wishlist.created_at.desc(), Wishlist.id.desc())
+        .limit(limit + 1)
     )
-    if load_items:
-        q = q.options(selectinload(Wishlist.items))
-    result = await session.execute(q)
-    return list(result.scalars().all())
+    if cursor:
+        created_at, wishlist_id = decode_cursor(cursor, datetime, UUID)
+        page_q = page_q.where(tuple_(Wishlist.created_at, Wishlist.id) < (created_at, wishlist_id))
+    page = page_q.cte("page")
+
+    priced = Item.price > 0
+    stats = (
+        select(
+            Item.wishlist_id,
+            func.count(Item.id).label("items_count"),
+            func.sum(Item.reserved_total).label("reserved_total"),
+            func.sum(Item.price).filter(priced).label("target_total"),
+            func.sum(func.least(Item.reserved_total, Item.price)).filter(priced).label("funded_total"),
+        )
+        .where(Item.wishlist_id.in_(select(page.c.id)))
+        .group_by(Item.wishlist_id)
+        .subquery("stats")
+    )
+    result = await session.execute(
+        select(
+            page,
+            func.coalesce(stats.c.items_count, 0),
+            func.coalesce(stats.c.reserved_total, 0),
+            stats.c.target_total,
+            stats.c.funded_total,
+        )
+        .outerjoin(stats, stats.c.wishlist_id == page.c.id)
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    )
+    rows = [WishlistSummary(*row) for row in result.all()]
+    return build_page(rows, limit, key=lambda w: (w.created_at, w.id))
 
 
 async def create_wishlist(
@@ -73,9 +166,11 @@ async def update_wishlist(
             setattr(wishlist, k, v)
     await session.flush()
     await session.refresh(wishlist)
+    mark_changed(session, wishlist_key(wishlist.id))
     return wishlist
 
 
 async def delete_wishlist(session: AsyncSession, wishlist: Wishlist) -> None:
     await session.delete(wishlist)
     await session.flush()
+    mark_changed(session, wishlist_key(wishlist.id))
@@ -0,0 +1,171 @@
+"""Broadcast backplane: carries WebSocket events to every process serving the app.
+
+Each event gets the wishlist's next sequence number, is serialized once (with "seq"), and
+the backplane calls deliver(wishlist_id, payload, seq) in each process; each process then
+writes only to its own sockets and keeps the event for replay (see ConnectionManager).
+
+The Postgres backplane takes the number from wishlists.event_seq and sends the NOTIFY in the
+same transaction, so every process sees a wishlist's events in seq order. It delivers locally
+right away and skips its own echo. Events too large for NOTIFY reach other processes as a
+"wishlist_changed" event with the same seq, telling their clients to refetch.
+"""
+
+import json
+import logging
+import uuid
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from sqlalchemy import text
+
+from app.core.config import get_settings
+from app.db.notify import NOTIFY_MAX_PAYLOAD_BYTES, pg_listener
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+# Sent instead of an event that could not cross processes (no seq: delivery gap)
+RESYNC_EVENT = '{"type":"wishlist_changed"}'
+
+Deliver = Callable[[str, str, int | None], None]
+
+
+def _serialize(message: dict[str, Any], seq: int) -> str:
+    return json.dumps({**message, "seq": seq})
+
+
+class InMemoryBackplane:
+    """Loopback for a single process and tests: sequence numbers are per-process counters and
+    publish delivers straight to local sockets.
+    """
+
+    def __init__(self) -> None:
+        self._deliver: Deliver | None = None
+        self._local_wishlists: Callable[[], Iterable[str]] = tuple
+        self._seq: dict[str, int] = {}
+        self.published = 0
+        self.received = 0
+
+    def bind(self, deliver: Deliver, local_wishlists: Callable[[], Iterable[str]]) -> None:
+        """deliver(wishlist_id, payload, seq) writes to this process's subscribers and must not
+        block; local_wishlists() lists wishlist ids that have subscribers here.
+        """
+        self._deliver = deliver
+        self._local_wishlists = local_wishlists
+
+    def _deliver_local(self, wishlist_id: str, payload: str, seq: int | None) -> None:
+        if self._deliver is not None:
+            self._deliver(wishlist_id, payload, seq)
+
+    async def publish(self, wishlist_id: str, message: dict[str, Any]) -> None:
+        """Stamp message with the next seq, serialize it once and deliver it everywhere.
+        Raises TypeError/ValueError if message is not JSON-serializable.
+        """
+        seq = self._seq.get(wishlist_id, 0) + 1
+        payload = _serialize(message, seq)
+        self._seq[wishlist_id] = seq
+        self.published += 1
+        self._deliver_local(wishlist_id, payload, seq)
+
+    async def current_seq(self, wishlist_id: str) -> int | None:
+        """Latest seq issued for the wishlist (0 if none); None if it cannot be determined."""
+        return self._seq.get(wishlist_id, 0)
+
+    async def start(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, int | str]:
+        return {"backend": "memory", "published": self.published, "received": self.received}
+
+
+class PostgresBackplane(InMemoryBackplane):
+    """LISTEN/NOTIFY on channel ws_broadcast. Messages are "<origin>:<wishlist_id>:<seq>:<payload>"
+    so the already-serialized event is forwarded verbatim, never re-encoded.
+    """
+
+    channel = "ws_broadcast"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.origin = uuid.uuid4().hex
+        self.oversize = 0
+        self.errors = 0
+
+    async def publish(self, wishlist_id: str, message: dict[str, Any]) -> None:
+        try:
+            async with engine.begin() as conn:
+                # Row lock on the wishlist until commit: NOTIFYs go out in seq order
+                result = await conn.execute(
+                    text("UPDATE wishlists SET event_seq = event_seq + 1 WHERE id = :id RETURNING event_seq"),
+                    {"id": wishlist_id},
+                )
+                seq = result.scalar_one_or_none()
+                if seq is None:
+                    return  # wishlist deleted meanwhile: nobody left to tell
+                payload = _serialize(message, seq)
+                notify = f"{self.origin}:{wishlist_id}:{seq}:{payload}"
+                if len(notify.encode()) > NOTIFY_MAX_PAYLOAD_BYTES:
+                    self.oversize += 1
+                    notify = f"{self.origin}:{wishlist_id}:{seq}:"
+                await conn.execute(
+                    text("SELECT pg_notify(:channel, :message)"),
+                    {"channel": self.channel, "message": notify},
+                )
+        except (TypeError, ValueError):
+            raise
+        except Exception as e:
+            # Still reach this process's clients; without a seq they cannot replay it, but a
+            # later gap makes them resync
+            self.errors += 1
+            logger.warning("WS backplane publish failed for wishlist %s: %s", wishlist_id, e)
+            self._deliver_local(wishlist_id, json.dumps(message), None)
+            return
+        self.published += 1
+        self._deliver_local(wishlist_id, payload, seq)
+
+    async def current_seq(self, wishlist_id: str) -> int | None:
+        try:
+            async with engine.connect() as conn:
+                result = await conn.execute(
+                    text("SELECT event_seq FROM wishlists WHERE id = :id"), {"id": wishlist_id}
+                )
+                return result.scalar_one_or_none() or 0
+        except Exception as e:
+            logger.warning("Could not read event_seq of wishlist %s: %s", wishlist_id, e)
+            return None
+
+    def _on_notify(self, message: str) -> None:
+        origin, wishlist_id, seq_text, payload = (message.split(":", 3) + ["", "", ""])[:4]
+        if origin == self.origin or not wishlist_id:
+            return
+        try:
+            seq = int(seq_text)
+        except ValueError:
+            logger.warning("Ignoring malformed WS backplane message: %.200s", message)
+            return
+        self.received += 1
+        if not payload:
+            payload = _serialize({"type": "wishlist_changed"}, seq)
+        self._deliver_local(wishlist_id, payload, seq)
+
+    def _resync_local(self) -> None:
+        """After a LISTEN reconnect events may have been missed: every local client refetches."""
+        for wishlist_id in list(self._local_wishlists()):
+            self._deliver_local(wishlist_id, RESYNC_EVENT, None)
+
+    async def start(self) -> None:
+        """Register with pg_listener; the caller starts the listener."""
+        pg_listener.add_handler(self.channel, self._on_notify)
+        pg_listener.on_reconnect(self._resync_local)
+
+    def stats(self) -> dict[str, int | str]:
+        return {**super().stats(), "backend": "postgres", "oversize": self.oversize, "errors": self.errors}
+
+
+def create_backplane() -> InMemoryBackplane:
+    backend = get_settings().ws_backplane
+    if backend == "memory":
+        return InMemoryBackplane()
+    if backend == "postgres":
+        return PostgresBackplane()
+    raise ValueError(f"Unknown WS_BACKPLANE {backend!r} (expected postgres or memory)")
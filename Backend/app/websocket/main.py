@@ -7,10 +7,27 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
-from app.db.base import Base
+from app.core.http_clients import http_clients
+from app.core.security import password_hash_executor
+from app.db.migrations import current_revision, head_revision
+from app.db.notify import pg_listener
 from app.db.session import engine
-from app.models import Item, Reservation, User, Wishlist  # noqa: F401 - register with Base.metadata
-from app.routers import auth, items, product, public, pusher_auth, reservations, users, wishlists, ws
+from app.routers import (
+    auth,
+    dashboard,
+    internal,
+    items,
+    product,
+    public,
+    pusher_auth,
+    reservations,
+    users,
+    wishlists,
+    ws,
+)
+from app.services.invalidation import invalidation_bus
+from app.services.product_fetch import html_parse_executor
+from app.websocket.manager import manager
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -18,14 +35,31 @@ settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create tables if missing (e.g. first deploy on Railway; idempotent).
+    # Schema is managed by Alembic (python -m scripts.init_db / alembic upgrade head runs before
+    # uvicorn in Procfile/Dockerfile). Here we only compare the stamped revision with the head.
     # If DB is unreachable, log and continue so the app stays up and /health works.
+    app.state.schema_revision = None
     try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        app.state.schema_revision = await current_revision(engine)
+        if app.state.schema_revision != head_revision():
+            logger.warning(
+                "Database schema is at %s but code expects %s; run: alembic upgrade head",
+                app.state.schema_revision,
+                head_revision(),
+            )
     except Exception as e:
-        logger.warning("Could not create DB tables (check DATABASE_URL and that DB is reachable): %s", e)
+        logger.warning("Could not check DB schema version (check DATABASE_URL and that DB is reachable): %s", e)
+    # Cross-worker cache invalidation and WS fan-out share one LISTEN connection per process;
+    # it is only opened if a Postgres backend registered a channel, and retries in the background
+    await invalidation_bus.start()
+    await manager.backplane.start()
+    pg_listener.start()
+    http_clients.start()
     yield
+    await http_clients.aclose()
+    await pg_listener.stop()
+    password_hash_executor.shutdown()
+    html_parse_executor.shutdown()
 
 
 app = FastAPI(
@@ -52,22 +86,24 @@ app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 app.include_router(product.router, prefix="/api")
 app.include_router(wishlists.router, prefix="/api")
+app.include_router(dashboard.router, prefix="/api")
 app.include_router(items.router, prefix="/api")
 app.include_router(reservations.router, prefix="/api")
 app.include_router(public.router, prefix="/api")
 app.include_router(ws.router, prefix="/api")
 app.include_router(pusher_auth.router, prefix="/api")
+app.include_router(internal.router, prefix="/api")
 
 
 @app.get("/health")
 async def health():
-    """Always 200 so Railway does not kill the container. Body shows db status."""
+    """Always 200 so Railway does not kill the container. Body shows db and schema status."""
     db_ok = False
+    schema = "unknown"
     try:
-        from sqlalchemy import text
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
+        revision = await current_revision(engine)
         db_ok = True
+        schema = "ok" if revision == head_revision() else "outdated"
     except Exception as e:
         logger.warning("Health check: DB unreachable: %s", e)
-    return {"status": "ok", "db": "ok" if db_ok else "unavailable"}
+    return {"status": "ok", "db": "ok" if db_ok else "unavailable", "schema": schema}
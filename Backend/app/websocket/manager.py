@@ -1,86 +1,279 @@
-"""WebSocket connection manager for real-time broadcasting."""
+"""WebSocket connection manager for real-time broadcasting.
+Events go through the backplane (app/websocket/backplane.py) so viewers connected to any
+worker or replica receive them; each process writes only to its own sockets.
+Events carry a per-wishlist "seq"; the last few per wishlist are kept so a client that
+reconnects with ?last_seq=N gets what it missed, or a "resync" event if that is not possible.
+"""
 
+import asyncio
 import json
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Any
 
 from fastapi import WebSocket
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.websocket.backplane import InMemoryBackplane, create_backplane
+
 logger = logging.getLogger(__name__)
 
 
+# Close code for clients that cannot keep up ("Try Again Later"); they reconnect and refetch
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class Subscriber:
+    """One WebSocket connection with its own bounded outbound queue, drained by a writer task.
+    All writes go through the queue, so a slow client only ever delays itself.
+    """
+
+    __slots__ = ("websocket", "wishlist_id", "queue", "_writer")
+
+    def __init__(self, websocket: WebSocket, wishlist_id: str, queue_size: int) -> None:
+        self.websocket = websocket
+        self.wishlist_id = wishlist_id
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self._writer: asyncio.Task | None = None
+
+    def send(self, payload: str) -> bool:
+        """Enqueue without waiting; False if the queue is full."""
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+
 class ConnectionManager:
     """Manage WebSocket connections per wishlist for real-time updates.
     Maintains active connections per wishlist and broadcasts events without exposing user identity.
+    Delivery is a non-blocking enqueue per subscriber; clients whose queue overflows are closed
+    with SLOW_CONSUMER_CLOSE_CODE.
     """
 
-    def __init__(self) -> None:
-        # wishlist_id -> set of WebSocket
-        self._connections: dict[str, set[WebSocket]] = defaultdict(set)
+    def __init__(
+        self,
+        backplane: InMemoryBackplane,
+        queue_size: int,
+        replay_size: int,
+        replay_wishlists: int,
+        replay_ttl: float,
+    ) -> None:
+        # wishlist_id -> subscribers (this process only)
+        self._connections: dict[str, set[Subscriber]] = defaultdict(set)
+        self._queue_size = queue_size
+        # wishlist_id -> recent (seq, payload), ascending; kept whether or not anyone listens here
+        self._replay: TTLCache[str, deque[tuple[int, str]]] = TTLCache(
+            maxsize=replay_wishlists, ttl=replay_ttl
+        )
+        self._replay_size = replay_size
+        self.replayed = 0
+        self.resyncs = 0
+        self._close_tasks: set[asyncio.Task] = set()
+        self.backplane = backplane
+        backplane.bind(self.deliver_local, lambda: self._connections.keys())
+        self.delivered = 0
+        self.dropped_slow = 0
+        self.send_errors = 0
 
-    async def connect(self, websocket: WebSocket, wishlist_id: str) -> None:
+    async def connect(
+        self, websocket: WebSocket, wishlist_id: str, last_seq: int | None = None
+    ) -> Subscriber:
+        """Register a client. With last_seq, first queue the events it missed (or a resync)."""
         await websocket.accept()
-        self._connections[wishlist_id].add(websocket)
+        current_seq = None
+        if last_seq is not None and not self._replay.get(wishlist_id):
+            # Nothing buffered here: ask the backplane whether anything happened at all
+            current_seq = await self.backplane.current_seq(wishlist_id)
+        subscriber = Subscriber(websocket, wishlist_id, self._queue_size)
+        # No await from here on: replay and registration happen before any new event
+        if last_seq is not None:
+            for payload in self._missed_events(wishlist_id, last_seq, current_seq):
+                subscriber.send(payload)
+        subscriber._writer = asyncio.create_task(self._write_loop(subscriber))
+        self._connections[wishlist_id].add(subscriber)
+        return subscriber
 
-    def disconnect(self, websocket: WebSocket, wishlist_id: str) -> None:
-        self._connections[wishlist_id].discard(websocket)
-        if not self._connections[wishlist_id]:
-            del self._connections[wishlist_id]
+    def _remember(self, wishlist_id: str, seq: int, payload: str) -> None:
+        buffer = self._replay.get(wishlist_id)
+        if buffer is None:
+            buffer = deque(maxlen=self._replay_size)
+            self._replay.set(wishlist_id, buffer)
+        if not buffer or seq > buffer[-1][0]:
+            buffer.append((seq, payload))
+            return
+        # Out of order (NOTIFY from another process overtaken by a local publish): keep sorted
+        seqs = [s for s, _ in buffer]
+        if seq in seqs or (seq < seqs[0] and len(buffer) == buffer.maxlen):
+            return
+        index = next(i for i, s in enumerate(seqs) if s > seq)
+        if len(buffer) == buffer.maxlen:
+            buffer.popleft()
+            index -= 1
+        buffer.insert(index, (seq, payload))
+
+    def _missed_events(self, wishlist_id: str, last_seq: int, current_seq: int | None) -> list[str]:
+        """Events after last_seq if they are all buffered (contiguous), else one resync event."""
+        buffer = list(self._replay.get(wishlist_id) or ())
+        latest = max(buffer[-1][0] if buffer else 0, current_seq or 0)
+        if (buffer or current_seq is not None) and last_seq == latest:
+            return []
+        missed = [(s, p) for s, p in buffer if s > last_seq]
+        contiguous = all(s == last_seq + 1 + i for i, (s, _) in enumerate(missed))
+        if last_seq < latest and missed and contiguous and len(missed) < self._queue_size:
+            self.replayed += len(missed)
+            return [p for _, p in missed]
+        # Gap too large, unknown history, or a client ahead of us (state reset): refetch
+        self.resyncs += 1
+        return [json.dumps({"type": "resync", "seq": latest if (buffer or current_seq is not None) else None})]
+
+    def disconnect(self, subscriber: Subscriber) -> None:
+        """Forget the subscriber and stop its writer (idempotent)."""
+        if subscriber._writer is not None:
+            subscriber._writer.cancel()
+            subscriber._writer = None
+        conns = self._connections.get(subscriber.wishlist_id)
+        if conns is None:
+            return
+        conns.discard(subscriber)
+        if not conns:
+            del self._connections[subscriber.wishlist_id]
 
     def active_connections_count(self, wishlist_id: str) -> int:
         return len(self._connections.get(wishlist_id, set()))
 
+    async def _write_loop(self, subscriber: Subscriber) -> None:
+        """Drain the subscriber's queue; on send failure we log and discard the connection."""
+        try:
+            while True:
+                payload = await subscriber.queue.get()
+                await subscriber.websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug("broadcast_to_wishlist: send failed for one client: %s", e)
+            self.send_errors += 1
+            subscriber._writer = None
+            self.disconnect(subscriber)
+
+    def _drop_slow(self, subscriber: Subscriber) -> None:
+        self.dropped_slow += 1
+        logger.info("Closing slow WebSocket client on wishlist %s (queue full)", subscriber.wishlist_id)
+        self.disconnect(subscriber)
+        task = asyncio.get_running_loop().create_task(
+            self._close(subscriber.websocket, SLOW_CONSUMER_CLOSE_CODE, "Client too slow")
+        )
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int, reason: str) -> None:
+        try:
+            await websocket.close(code=code, reason=reason)
+        except Exception:
+            pass  # already gone
+
     async def broadcast_to_wishlist(
         self, wishlist_id: str, message: dict[str, Any]
     ) -> None:
-        """Send message to all clients subscribed to this wishlist.
-        On send failure we log and discard the connection; never crash.
+        """Send message to all clients subscribed to this wishlist, in every process.
+        Serialized once here; on failure we log and drop the event; never crash.
         """
         try:
-            payload = json.dumps(message)
+            await self.backplane.publish(wishlist_id, message)
         except (TypeError, ValueError) as e:
             logger.warning("broadcast_to_wishlist: failed to serialize message: %s", e)
-            return
-        dead = set()
-        for ws in self._connections.get(wishlist_id, set()):
-            try:
-                await ws.send_text(payload)
-            except Exception as e:
-                logger.debug("broadcast_to_wishlist: send failed for one client: %s", e)
-                dead.add(ws)
-        for ws in dead:
-            self._connections[wishlist_id].discard(ws)
+
+    def deliver_local(self, wishlist_id: str, payload: str, seq: int | None) -> None:
+        """Backplane callback: enqueue an already-serialized event for this process's clients
+        and keep it for replay. O(subscribers), never waits on a socket.
+        """
+        if seq is not None:
+            self._remember(wishlist_id, seq, payload)
+        for subscriber in list(self._connections.get(wishlist_id, ())):
+            if subscriber.send(payload):
+                self.delivered += 1
+            else:
+                self._drop_slow(subscriber)
+
+    def stats(self) -> dict[str, int]:
+        depths = [sub.queue.qsize() for subs in self._connections.values() for sub in subs]
+        return {
+            "wishlists": len(self._connections),
+            "connections": len(depths),
+            "queue_size": self._queue_size,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "delivered": self.delivered,
+            "dropped_slow": self.dropped_slow,
+            "send_errors": self.send_errors,
+            "replay_wishlists": len(self._replay),
+            "replayed": self.replayed,
+            "resyncs": self.resyncs,
+        }
 
     @staticmethod
-    def build_item_state_event(
+    def _reservation_for_event(r: dict[str, Any]) -> dict[str, Any]:
+        """Anonymous view of one reservation: no user_id or guest_name."""
+        created_at = r.get("created_at")
+        if isinstance(created_at, datetime):
+            created_at = created_at.isoformat()
+        return {
+            "id": r.get("id"),
+            "amount": r.get("amount"),
+            "is_full_reservation": r.get("is_full_reservation", False),
+            "created_at": created_at,
+        }
+
+    @staticmethod
+    def build_reservation_event(
         event_type: str,
         item_id: str,
         reserved_total: float,
-        contributors_count: int = 0,
-        reservations: list[dict[str, Any]] | None = None,
+        contributors_count: int,
+        reservation: dict[str, Any],
     ) -> dict[str, Any]:
-        """Build event payload with updated item state. No user_id or guest_name."""
-        out = []
-        for r in reservations or []:
-            created_at = r.get("created_at")
-            if isinstance(created_at, datetime):
-                created_at = created_at.isoformat()
-            out.append({
-                "id": r.get("id"),
-                "amount": r.get("amount"),
-                "is_full_reservation": r.get("is_full_reservation", False),
-                "created_at": created_at,
-            })
+        """Delta event for one new reservation: the reservation itself plus the item's new totals.
+        version is the item's contributors_count, which every reservation bumps by exactly one
+        under the item's row lock, so a client holding version N applies only version N + 1 and
+        asks for an item_state (see build_item_state_event) on any other gap.
+        """
         return {
             "type": event_type,
             "item_id": item_id,
             "reserved_total": reserved_total,
             "contributors_count": contributors_count,
-            "reservations": out,
+            "version": contributors_count,
+            "reservation": ConnectionManager._reservation_for_event(reservation),
+        }
+
+    @staticmethod
+    def build_item_state_event(
+        item_id: str,
+        reserved_total: float,
+        contributors_count: int,
+        reservations: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Full item state (every anonymous reservation), sent only to a client that asked to resync."""
+        return {
+            "type": "item_state",
+            "item_id": item_id,
+            "reserved_total": reserved_total,
+            "contributors_count": contributors_count,
+            "version": contributors_count,
+            "reservations": [ConnectionManager._reservation_for_event(r) for r in reservations],
         }
 
 
 # Singleton used by routes
-manager = ConnectionManager()
+_settings = get_settings()
+manager = ConnectionManager(
+    create_backplane(),
+    queue_size=_settings.ws_send_queue_size,
+    replay_size=_settings.ws_replay_size,
+    replay_wishlists=_settings.ws_replay_wishlists,
+    replay_ttl=_settings.ws_replay_ttl_seconds,
+)
@@ -0,0 +1,45 @@
+"""Backfill / repair Item.reserved_total and Item.contributors_count from reservations.
+Use from Backend dir: python -m scripts.backfill_item_totals
+
+Safe to re-run: adds the columns if an older database lacks them, then rewrites only
+items whose stored totals drifted from SUM/COUNT over their reservations.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import get_settings
+from app.services.reservation_service import recompute_item_totals
+
+ADD_COLUMNS = (
+    "ALTER TABLE items ADD COLUMN IF NOT EXISTS reserved_total NUMERIC(12, 2) NOT NULL DEFAULT 0",
+    "ALTER TABLE items ADD COLUMN IF NOT EXISTS contributors_count INTEGER NOT NULL DEFAULT 0",
+)
+
+
+async def main():
+    settings = get_settings()
+    url = settings.database_url
+    # Hide password in logs
+    safe_url = url.split("@")[-1] if "@" in url else url
+    print(f"Connecting to {safe_url} ...")
+    engine = create_async_engine(url)
+    try:
+        async with engine.begin() as conn:
+            for stmt in ADD_COLUMNS:
+                await conn.execute(text(stmt))
+        async with AsyncSession(engine) as session:
+            async with session.begin():
+                fixed = await recompute_item_totals(session)
+        print(f"Repaired totals on {fixed} item(s).")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+"""Benchmark product meta extraction: MetaTagExtractor vs the former BeautifulSoup lookups.
+Use from Backend dir: python -m scripts.bench_meta_extract [CORPUS_DIR] [--repeat 20]
+
+CORPUS_DIR holds saved retailer pages (*.html / *.htm, any charset declared in <meta>);
+without it, synthetic pages of growing size are generated. For each page both extractors
+run over the full document (no early stop, so the comparison is parse cost only). The new
+side does the same first_meta lookups as snapshot_from_meta, so title, image, price amount
+and currency must match the old og:/product:-only lookups wherever those found a value;
+fields the old code left empty and the new fallbacks (og:image:url, og:image:secure_url,
+twitter:*) fill in are counted separately. Prints per-page and total timings.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from app.services.meta_extractor import extract_meta, first_meta
+from app.services.product_fetch import (
+    IMAGE_KEYS,
+    PRICE_AMOUNT_KEYS,
+    PRICE_CURRENCY_KEYS,
+    TITLE_KEYS,
+    _META_CHARSET,
+)
+
+
+def legacy_extract(html: str) -> tuple[str | None, ...]:
+    """The pre-extractor implementation: one soup.find per candidate attribute."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    def first(props: list[tuple[str, str]]) -> str | None:
+        for attr, value in props:
+            tag = soup.find("meta", attrs={attr: value})
+            if tag and tag.get("content"):
+                return tag["content"].strip()
+        return None
+
+    def both(key: str) -> list[tuple[str, str]]:
+        return [("property", key), ("name", key)]
+
+    return (
+        first(both("og:title")),
+        first(both("og:image")),
+        first(both("product:price:amount") + both("og:price:amount")),
+        first(both("product:price:currency") + both("og:price:currency")),
+    )
+
+
+def new_extract(html: str) -> tuple[str | None, ...]:
+    """The lookups snapshot_from_meta does, fallback keys included."""
+    meta = extract_meta(html).meta
+    return (
+        first_meta(meta, *TITLE_KEYS),
+        first_meta(meta, *IMAGE_KEYS),
+        first_meta(meta, *PRICE_AMOUNT_KEYS),
+        first_meta(meta, *PRICE_CURRENCY_KEYS),
+    )
+
+
+def compare(legacy: tuple[str | None, ...], new: tuple[str | None, ...]) -> tuple[bool, int]:
+    """(agree, fields filled only by the new fallbacks)."""
+    agree, filled = True, 0
+    for old_value, new_value in zip(legacy, new):
+        if old_value is None and new_value is not None:
+            filled += 1
+        elif old_value != new_value:
+            agree = False
+    return agree, filled
+
+
+def synthetic_pages() -> list[tuple[str, str]]:
+    head = (
+        '<head><meta charset="utf-8"><title>Product</title>'
+        + '<link rel="stylesheet" href="/s.css">' * 20
+        + '<meta property="og:title" content="Кофемашина &amp; капучинатор">'
+        '<meta property="og:image" content="https://cdn.example.com/p/1.jpg">'
+        '<meta property="product:price:amount" content="12 990">'
+        '<meta property="product:price:currency" content="RUB">'
+        + '<script>var x = "<div>";</script>' * 10
+        + "</head>"
+    )
+    card = '<div class="card"><a href="/p/{0}"><img src="/i/{0}.jpg" alt="item {0}"></a><span>{0} ₽</span></div>'
+    pages = []
+    for cards in (10, 200, 2000, 10000):
+        body = "".join(card.format(i) for i in range(cards))
+        html = f"<!doctype html><html>{head}<body>{body}</body></html>"
+        pages.append((f"synthetic-{cards}-cards", html))
+    # No og:title / og:image: the fallback keys must be picked up
+    fallback_head = (
+        head.replace('property="og:title"', 'name="twitter:title"')
+        .replace('property="og:image"', 'property="og:image:secure_url"')
+    )
+    pages.append(("synthetic-fallbacks", f"<!doctype html><html>{fallback_head}<body></body></html>"))
+    return pages
+
+
+def load_corpus(directory: Path) -> list[tuple[str, str]]:
+    pages = []
+    for path in sorted(p for p in directory.iterdir() if p.suffix.lower() in (".html", ".htm")):
+        raw = path.read_bytes()
+        match = _META_CHARSET.search(raw, 0, 4096)
+        charset = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+        try:
+            pages.append((path.name, raw.decode(charset, errors="replace")))
+        except LookupError:
+            pages.append((path.name, raw.decode("utf-8", errors="replace")))
+    return pages
+
+
+def timed(fn, html: str, repeat: int) -> float:
+    """Median seconds per call."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("corpus", nargs="?", type=Path, help="directory of saved .html pages")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_pages()
+    if not pages:
+        print("No .html pages found")
+        sys.exit(1)
+
+    mismatches = fallbacks = 0
+    total_legacy = total_new = 0.0
+    print(f"{'page':<40} {'KB':>8} {'bs4 ms':>9} {'new ms':>9} {'speedup':>8}")
+    for name, html in pages:
+        legacy, new = legacy_extract(html), new_extract(html)
+        agree, filled = compare(legacy, new)
+        if not agree:
+            mismatches += 1
+            print(f"  MISMATCH {name}: bs4={legacy} new={new}")
+        fallbacks += filled
+        t_legacy = timed(legacy_extract, html, args.repeat)
+        t_new = timed(new_extract, html, args.repeat)
+        total_legacy += t_legacy
+        total_new += t_new
+        print(
+            f"{name[:40]:<40} {len(html.encode()) / 1024:>8.1f} {t_legacy * 1000:>9.2f} "
+            f"{t_new * 1000:>9.2f} {t_legacy / t_new:>7.1f}x"
+        )
+    print(f"{'total':<40} {'':>8} {total_legacy * 1000:>9.2f} {total_new * 1000:>9.2f} {total_legacy / total_new:>7.1f}x")
+    if fallbacks:
+        print(f"{fallbacks} field(s) empty with og:/product: only, filled by fallback keys")
+    if mismatches:
+        print(f"{mismatches} page(s) extracted differently")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Concurrency stress test for create_reservation against a real PostgreSQL.
+Use from Backend dir: python -m scripts.stress_reservations [--contributions 300] [--concurrency 50]
+
+Creates a throwaway user/wishlist/item, fires all contributions at that one item at once
+(each in its own transaction, like separate HTTP requests), then checks that the item was
+never over-funded and that the denormalized totals match the reservations table.
+Prints throughput; exits non-zero on any inconsistency. Cleans up after itself.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.models import Item, Reservation, User, Wishlist
+from app.services.ranking import generate_key_between
+from app.services.reservation_service import ReservationBusyError, create_reservation
+
+
+async def _setup(session_factory, price: Decimal) -> tuple:
+    async with session_factory() as session:
+        async with session.begin():
+            user = User(
+                email=f"stress-{time.time_ns()}@example.invalid",
+                hashed_password="!",
+                name="Stress test",
+            )
+            session.add(user)
+            await session.flush()
+            wishlist = Wishlist(owner_id=user.id, title="Stress test")
+            session.add(wishlist)
+            await session.flush()
+            item = Item(wishlist_id=wishlist.id, rank=generate_key_between(None, None), title="Stress test item", price=price)
+            session.add(item)
+            await session.flush()
+            return user.id, item.id
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contributions", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50, help="DB connections in the pool")
+    parser.add_argument("--amount", type=Decimal, default=Decimal("1.00"))
+    parser.add_argument("--price", type=Decimal, default=Decimal("200.00"))
+    args = parser.parse_args()
+
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.database_url,
+        pool_size=args.concurrency,
+        max_overflow=0,
+        pool_timeout=120,
+    )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    user_id, item_id = await _setup(session_factory, args.price)
+    outcomes = {"accepted": 0, "rejected": 0, "busy": 0}
+
+    async def contribute() -> None:
+        async with session_factory() as session:
+            try:
+                async with session.begin():
+                    await create_reservation(session, item_id=item_id, amount=float(args.amount))
+                outcomes["accepted"] += 1
+            except ValueError:
+                outcomes["rejected"] += 1
+            except ReservationBusyError:
+                outcomes["busy"] += 1
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(contribute() for _ in range(args.contributions)))
+        elapsed = time.perf_counter() - started
+
+        async with session_factory() as session:
+            item = await session.get(Item, item_id)
+            total, count = (
+                await session.execute(
+                    select(func.coalesce(func.sum(Reservation.amount), 0), func.count(Reservation.id))
+                    .where(Reservation.item_id == item_id)
+                )
+            ).one()
+
+        print(f"{args.contributions} contributions of {args.amount} at price {args.price}")
+        print(f"  accepted={outcomes['accepted']} rejected={outcomes['rejected']} busy={outcomes['busy']}")
+        print(f"  {elapsed:.2f}s, {args.contributions / elapsed:.1f} attempts/s, "
+              f"{outcomes['accepted'] / elapsed:.1f} reservations/s")
+        print(f"  reservations: sum={total} count={count}; item: "
+              f"reserved_total={item.reserved_total} contributors_count={item.contributors_count}")
+
+        failures = []
+        if total > args.price:
+            failures.append("item over-funded")
+        if total != item.reserved_total or count != item.contributors_count:
+            failures.append("denormalized totals do not match reservations")
+        if count != outcomes["accepted"]:
+            failures.append("reservation rows do not match accepted requests")
+        expected = min(args.contributions, int(args.price // args.amount))
+        if outcomes["busy"] == 0 and outcomes["accepted"] != expected:
+            failures.append(f"expected {expected} accepted contributions")
+        for f in failures:
+            print(f"FAIL: {f}")
+        if failures:
+            sys.exit(1)
+        print("OK")
+    finally:
+        async with session_factory() as session:
+            async with session.begin():
+                await session.execute(delete(User).where(User.id == user_id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""Product page download: inline meta extraction vs. the parse pool."""
+
+import asyncio
+import gzip
+
+import httpx
+
+from app.services import product_fetch
+from app.services.product_fetch import _download_meta
+
+HEAD = (
+    '<html><head><meta charset="utf-8">'
+    '<meta property="og:title" content="Coffee machine">'
+    '<meta property="og:image" content="/p/1.jpg">'
+    "</head>"
+)
+
+
+def _gzip_page(html: str) -> httpx.MockTransport:
+    """Serves html gzip-encoded, so the whole page arrives as one decompressed chunk."""
+    body = gzip.compress(html.encode())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/html; charset=utf-8", "content-encoding": "gzip"},
+            content=body,
+        )
+
+    return httpx.MockTransport(handler)
+
+
+async def _download(transport: httpx.MockTransport, inline_max_bytes: int):
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await _download_meta(
+            client, "https://shop.example/p/1", max_bytes=1 << 20, inline_max_bytes=inline_max_bytes
+        )
+
+
+def test_short_head_in_large_gzip_chunk_is_parsed_inline():
+    html = HEAD + "<body>" + "<div>filler</div>" * 10_000 + "</body></html>"
+    assert len(html) > 64 * 1024
+    download = asyncio.run(_download(_gzip_page(html), inline_max_bytes=64 * 1024))
+    assert download.meta is not None
+    assert download.meta["og:title"] == "Coffee machine"
+    assert download.meta["og:image"] == "/p/1.jpg"
+
+
+def test_head_open_past_inline_limit_is_left_for_the_pool():
+    html = HEAD.replace("</head>", "<script>x</script>" * 8_000 + "</head>") + "<body></body></html>"
+    download = asyncio.run(_download(_gzip_page(html), inline_max_bytes=64 * 1024))
+    assert download.meta is None
+    assert download.body.startswith(b"<html><head>")
+    assert download.body.endswith(b"<script>x</script>")
+
+
+def test_fetch_product_counts_large_gzip_page_as_inline(monkeypatch):
+    html = HEAD + "<body>" + "<div>filler</div>" * 10_000 + "</body></html>"
+    monkeypatch.setattr(product_fetch, "parse_stats", product_fetch.ParseStats())
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=_gzip_page(html)) as client:
+            return await product_fetch.fetch_product("https://shop.example/p/gzip-inline", client=client)
+
+    snapshot = asyncio.run(fetch())
+    assert snapshot is not None and snapshot.title == "Coffee machine"
+    assert product_fetch.parse_stats.inline == 1
+    assert product_fetch.parse_stats.offloaded == 0
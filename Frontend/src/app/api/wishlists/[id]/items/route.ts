@@ -3,7 +3,7 @@ import { cookies } from "next/headers";
 import { AUTH_COOKIE_NAME, getBackendUrl } from "@/lib/auth-cookie";
 
 export async function GET(
-  _request: NextRequest,
+  request: NextRequest,
   { params }: { params: Promise<{ id: string }> }
 ) {
   const { id } = await params;
@@ -11,13 +11,15 @@ export async function GET(
   const token = cookieStore.get(AUTH_COOKIE_NAME)?.value;
   if (!token) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
   const backend = getBackendUrl();
-  const res = await fetch(`${backend}/api/wishlists/${id}/items`, {
+  // Pass ?limit / ?cursor through and hand the next-page cursor back
+  const res = await fetch(`${backend}/api/wishlists/${id}/items${request.nextUrl.search}`, {
     headers: { Authorization: `Bearer ${token}` },
     cache: "no-store",
   });
   const data = await res.json().catch(() => ({}));
   if (!res.ok) return NextResponse.json(data, { status: res.status });
-  return NextResponse.json(data);
+  const nextCursor = res.headers.get("X-Next-Cursor");
+  return NextResponse.json(data, nextCursor ? { headers: { "X-Next-Cursor": nextCursor } } : undefined);
 }
 
 export async function POST(
@@ -2,18 +2,20 @@ import { NextRequest, NextResponse } from "next/server";
 import { cookies } from "next/headers";
 import { AUTH_COOKIE_NAME, getBackendUrl } from "@/lib/auth-cookie";
 
-export async function GET() {
+export async function GET(request: NextRequest) {
   const cookieStore = await cookies();
   const token = cookieStore.get(AUTH_COOKIE_NAME)?.value;
   if (!token) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
   const backend = getBackendUrl();
-  const res = await fetch(`${backend}/api/wishlists`, {
+  // Pass ?limit / ?cursor through and hand the next-page cursor back
+  const res = await fetch(`${backend}/api/wishlists${request.nextUrl.search}`, {
     headers: { Authorization: `Bearer ${token}` },
     cache: "no-store",
   });
   const data = await res.json().catch(() => ({}));
   if (!res.ok) return NextResponse.json(data, { status: res.status });
-  return NextResponse.json(data);
+  const nextCursor = res.headers.get("X-Next-Cursor");
+  return NextResponse.json(data, nextCursor ? { headers: { "X-Next-Cursor": nextCursor } } : undefined);
 }
 
 export async function POST(request: NextRequest) {
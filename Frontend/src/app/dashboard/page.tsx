@@ -1,5 +1,6 @@
 import { cookies } from "next/headers";
 import { redirect } from "next/navigation";
+import Link from "next/link";
 import { AUTH_COOKIE_NAME, getBackendUrl } from "@/lib/auth-cookie";
 import { Button } from "@/components/ui/button";
 import {
@@ -24,12 +25,18 @@ type Wishlist = {
   deadline: string | null;
   created_at: string;
   items_count: number;
+  reserved_total: number;
+  funded_percent: number | null;
 };
 
-async function getMe(token: string): Promise<User | null> {
+type Dashboard = { user: User; wishlists: Wishlist[]; next_cursor: string | null };
+
+// Profile and one page of wishlists (newest first, with progress) in a single request
+async function getDashboard(token: string, cursor?: string): Promise<Dashboard | null> {
   try {
     const backend = getBackendUrl();
-    const res = await fetch(`${backend}/api/users/me`, {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    const res = await fetch(`${backend}/api/dashboard${query}`, {
       headers: { Authorization: `Bearer ${token}` },
       cache: "no-store",
     });
@@ -40,30 +47,19 @@ async function getMe(token: string): Promise<User | null> {
   }
 }
 
-async function getWishlists(token: string): Promise<Wishlist[]> {
-  try {
-    const backend = getBackendUrl();
-    const res = await fetch(`${backend}/api/wishlists`, {
-      headers: { Authorization: `Bearer ${token}` },
-      cache: "no-store",
-    });
-    if (!res.ok) return [];
-    return res.json();
-  } catch {
-    return [];
-  }
-}
-
-export default async function DashboardPage() {
+export default async function DashboardPage({
+  searchParams,
+}: {
+  searchParams: Promise<{ cursor?: string }>;
+}) {
   const cookieStore = await cookies();
   const token = cookieStore.get(AUTH_COOKIE_NAME)?.value;
   if (!token) redirect("/login");
+  const { cursor } = await searchParams;
 
-  const [user, wishlists] = await Promise.all([
-    getMe(token),
-    getWishlists(token),
-  ]);
-  if (!user) redirect("/login");
+  const dashboard = await getDashboard(token, cursor);
+  if (!dashboard) redirect("/login");
+  const { user, wishlists, next_cursor: nextCursor } = dashboard;
 
   return (
     <div className="space-y-6">
@@ -94,6 +90,21 @@ export default async function DashboardPage() {
             ))}
           </ul>
 
+          {(cursor || nextCursor) && (
+            <div className="flex gap-3">
+              {cursor && (
+                <Button asChild variant="outline">
+                  <Link href="/dashboard">В начало</Link>
+                </Button>
+              )}
+              {nextCursor && (
+                <Button asChild variant="outline">
+                  <Link href={`/dashboard?cursor=${encodeURIComponent(nextCursor)}`}>Показать ещё</Link>
+                </Button>
+              )}
+            </div>
+          )}
+
           <Dialog>
             <DialogTrigger asChild>
               <Button size="lg" className="w-full sm:w-auto">
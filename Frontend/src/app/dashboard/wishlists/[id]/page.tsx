@@ -20,6 +20,21 @@ async function api<T>(url: string, options?: RequestInit): Promise<T> {
   return res.json();
 }
 
+// List endpoints are paginated: follow the X-Next-Cursor header until the last page
+async function apiAll<T>(url: string): Promise<T[]> {
+  const all: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const sep = url.includes("?") ? "&" : "?";
+    const pageUrl: string = cursor ? `${url}${sep}cursor=${encodeURIComponent(cursor)}` : url;
+    const res = await fetch(pageUrl, { credentials: "include" });
+    if (!res.ok) throw new Error(res.statusText);
+    all.push(...((await res.json()) as T[]));
+    cursor = res.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return all;
+}
+
 export default function WishlistEditPage() {
   const router = useRouter();
   const params = useParams();
@@ -41,7 +56,7 @@ export default function WishlistEditPage() {
     if (!id) return;
     Promise.all([
       api<Wishlist>(`/api/wishlists/${id}`),
-      api<Item[]>(`/api/wishlists/${id}/items`),
+      apiAll<Item>(`/api/wishlists/${id}/items?limit=200`),
     ])
       .then(([w, list]) => {
         setWishlist(w);
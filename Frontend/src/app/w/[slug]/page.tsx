@@ -4,7 +4,7 @@
  * Public wishlist view at /w/[slug]. No auth required.
  * Fetches wishlist + items by slug, shows reserve/contribute buttons.
  */
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import { useParams } from "next/navigation";
 import Link from "next/link";
 import { toast } from "sonner";
@@ -22,6 +22,9 @@ export default function PublicWishlistPage() {
   const [guestName, setGuestName] = useState("");
   const [submitting, setSubmitting] = useState(false);
   const [wsState, setWsState] = useState<WsConnectionState>("disconnected");
+  // Latest data for the WS handler, which must compare versions without re-subscribing
+  const dataRef = useRef<PublicWishlist | null>(null);
+  dataRef.current = data;
 
   const applyWsUpdate = useCallback((itemId: string, reservedTotal: number, contributorsCount: number) => {
     const safeTotal = Number(reservedTotal);
@@ -71,14 +74,22 @@ export default function PublicWishlistPage() {
   useEffect(() => {
     if (!data?.id) return;
     const unsubscribe = subscribeWishlist(data.id, {
-      onMessage: (msg) => {
-        if (msg.type === "item_reserved" || msg.type === "contribution_added") {
+      onMessage: (msg, actions) => {
+        if (msg.type === "item_reserved" || msg.type === "contribution_added" || msg.type === "item_state") {
+          const item = dataRef.current?.items.find((i) => i.id === msg.item_id);
+          if (!item || msg.version <= item.contributors_count) return; // unknown item or already applied
+          if (msg.type !== "item_state" && msg.version !== item.contributors_count + 1) {
+            actions.resyncItem(msg.item_id); // missed a delta: fetch the item's full state
+            return;
+          }
           applyWsUpdate(msg.item_id, msg.reserved_total, msg.contributors_count);
         } else if (
           msg.type === "item_created" ||
           msg.type === "item_updated" ||
           msg.type === "item_deleted" ||
-          msg.type === "items_reordered"
+          msg.type === "items_reordered" ||
+          msg.type === "wishlist_changed" ||
+          msg.type === "resync"
         ) {
           load();
         }
@@ -2,6 +2,8 @@
  * WebSocket client setup and wishlist subscriptions.
  * Uses the same base URL as the REST API (NEXT_PUBLIC_API_URL) so one env var works.
  * Auto-reconnects on disconnect; reports state for "Reconnecting..." UI.
+ * Events carry a per-wishlist "seq"; on reconnect the last seen one is sent as ?last_seq= so
+ * the server replays what was missed (or answers "resync" when it cannot).
  */
 
 import { getWsUrl } from "@/lib/api";
@@ -11,23 +13,52 @@ const WS_PATH = "/api/ws/wishlist";
 /** Connection state for UI (e.g. show "Reconnecting..." when reconnecting). */
 export type WsConnectionState = "connecting" | "connected" | "reconnecting" | "disconnected";
 
+/** A reservation as seen by everyone: no identity. */
+export interface AnonymousReservation {
+  id: string;
+  amount: number;
+  is_full_reservation: boolean;
+  created_at: string;
+}
+
 /** Message types broadcast by the backend for a wishlist (reservations, item CRUD). */
-export type WishlistWsMessage =
+export type WishlistWsMessage = (
   | { type: "pong" }
+  /** Delta: one new reservation; apply only if version is the item's current version + 1. */
   | {
       type: "item_reserved" | "contribution_added";
       item_id: string;
       reserved_total: number;
       contributors_count: number;
-      reservations?: unknown[];
+      version: number;
+      reservation: AnonymousReservation;
+    }
+  /** Full item state, sent only in reply to resyncItem(). */
+  | {
+      type: "item_state";
+      item_id: string;
+      reserved_total: number;
+      contributors_count: number;
+      version: number;
+      reservations: AnonymousReservation[];
     }
   | { type: "item_created"; item_id: string }
   | { type: "item_updated"; item_id: string }
   | { type: "item_deleted"; item_id: string }
-  | { type: "items_reordered" };
+  | { type: "items_reordered" }
+  /** Something changed but the details were not delivered (e.g. missed while reconnecting): refetch. */
+  | { type: "wishlist_changed" }
+  /** Missed events could not be replayed: refetch everything. */
+  | { type: "resync"; seq: number | null }
+) & { seq?: number | null };
+
+export interface WishlistSubscriptionActions {
+  /** Ask for an item's full state (answered with an item_state message), e.g. after a version gap. */
+  resyncItem: (itemId: string) => void;
+}
 
 export interface SubscribeWishlistCallbacks {
-  onMessage: (msg: WishlistWsMessage) => void;
+  onMessage: (msg: WishlistWsMessage, actions: WishlistSubscriptionActions) => void;
   onOpen?: () => void;
   onClose?: () => void;
   /** Called when connection state changes (for "Reconnecting..." banner). */
@@ -55,7 +86,8 @@ export function subscribeWishlist(
   wishlistId: string,
   { onMessage, onOpen, onClose, onStateChange }: SubscribeWishlistCallbacks
 ): () => void {
-  const url = getWsUrl(`${WS_PATH}/${wishlistId}`);
+  const baseUrl = getWsUrl(`${WS_PATH}/${wishlistId}`);
+  let lastSeq: number | null = null;
   let ws: WebSocket | null = null;
   let pingInterval: ReturnType<typeof setInterval> | null = null;
   let reconnectTimeout: ReturnType<typeof setTimeout> | null = null;
@@ -77,8 +109,15 @@ export function subscribeWishlist(
     onStateChange?.(state);
   }
 
+  const actions: WishlistSubscriptionActions = {
+    resyncItem(itemId) {
+      if (ws?.readyState === WebSocket.OPEN) ws.send(JSON.stringify({ type: "resync", item_id: itemId }));
+    },
+  };
+
   function connect() {
     if (intentionallyClosed) return;
+    const url = lastSeq === null ? baseUrl : `${baseUrl}?last_seq=${lastSeq}`;
     try {
       ws = new WebSocket(url);
     } catch (err) {
@@ -116,7 +155,10 @@ export function subscribeWishlist(
 
     ws.onmessage = (e) => {
       const msg = parseMessage(e.data as string);
-      if (msg) onMessage(msg);
+      if (!msg) return;
+      if (msg.type === "resync") lastSeq = msg.seq ?? null; // start over from the server's count
+      else if (typeof msg.seq === "number") lastSeq = Math.max(lastSeq ?? 0, msg.seq);
+      onMessage(msg, actions);
     };
 
     setState("connecting");